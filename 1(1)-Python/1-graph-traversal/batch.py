@@ -0,0 +1,84 @@
+from lib import Graph
+from concurrent.futures import ProcessPoolExecutor
+import io
+import os
+import sys
+
+
+"""
+1260 형식 입력 파일이 들어 있는 디렉토리를 한 번에 처리
+- 입력 파일 하나마다 워커 프로세스가 Graph를 만들고 DFS/BFS 결과를 계산
+- 결과는 입력 파일 이름 순서대로 출력
+
+사용법: python batch.py <input_dir> [output_dir] [workers]
+- output_dir가 없으면 모든 결과를 순서대로 표준 출력에 씀
+- output_dir가 있으면 "<이름>_input" -> "<이름>_output"
+  (그 외의 이름은 "<이름>.out") 파일로 저장
+"""
+
+
+def solve_file(path: str) -> str:
+    """
+    입력 파일 하나에 대해 search_and_print와 같은 출력을 문자열로 반환
+    """
+    with open(path, 'rb') as f:
+        N, M, V = map(int, f.readline().split())
+        graph = Graph.load_edges(f, N, M)
+
+    out = io.StringIO()
+    graph.search_and_print(V, out)
+    return out.getvalue()
+
+
+def output_name(input_name: str) -> str:
+    """
+    입력 파일 이름에 대응하는 출력 파일 이름
+    """
+    if input_name.endswith("_input"):
+        return input_name[:-len("_input")] + "_output"
+    return input_name + ".out"
+
+
+def run_batch(
+    input_dir: str,
+    output_dir: str | None = None,
+    workers: int | None = None
+) -> None:
+    """
+    input_dir의 모든 파일을 프로세스 풀에서 병렬로 처리
+    workers: 워커 프로세스 수 (None이면 CPU 코어 수)
+    """
+    names = sorted(
+        name for name in os.listdir(input_dir)
+        if os.path.isfile(os.path.join(input_dir, name))
+    )
+    paths = [os.path.join(input_dir, name) for name in names]
+
+    if output_dir is not None:
+        os.makedirs(output_dir, exist_ok=True)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # map yields results in input order even if workers finish out of order
+        for name, result in zip(names, executor.map(solve_file, paths)):
+            if output_dir is None:
+                sys.stdout.write(result)
+            else:
+                output_path = os.path.join(output_dir, output_name(name))
+                with open(output_path, 'w', encoding='utf-8') as f:
+                    f.write(result)
+
+
+def main() -> None:
+    if not 2 <= len(sys.argv) <= 4:
+        print("usage: python batch.py <input_dir> [output_dir] [workers]")
+        sys.exit(1)
+
+    input_dir = sys.argv[1]
+    output_dir = sys.argv[2] if len(sys.argv) >= 3 else None
+    workers = int(sys.argv[3]) if len(sys.argv) == 4 else None
+
+    run_batch(input_dir, output_dir, workers)
+
+
+if __name__ == "__main__":
+    main()
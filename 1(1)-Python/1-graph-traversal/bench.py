@@ -0,0 +1,222 @@
+from array import array
+from lib import Graph
+from time import perf_counter
+from typing import Callable, TypeVar
+import random
+import sys
+import tracemalloc
+
+
+"""
+Graph 벤치마크
+- 합성 그래프를 만들어 각 저장 방식/탐색 방식을 측정
+- 같은 입력에 대해 방식별 결과가 서로 같은지도 함께 확인
+
+사용법: python bench.py [suite] [n] [m]
+- suite: 아래 SUITES 중 하나 또는 all (기본값 all)
+  - csr: list-of-lists(add_edge) 대 CSR(from_edges)의 메모리와 dfs+bfs 시간
+  - direction: 멱법칙(power-law) 그래프에서 bfs의 queue/direction/numpy 모드
+  - weighted: 가중치 그래프에서 dijkstra와 zero_one_bfs의 처리량(간선/초)
+  - directed: 방향 그래프에서 topological_sort와 strongly_connected_components
+- n, m: 정점 수와 간선 수 (생략하면 suite별 기본값)
+"""
+
+
+T = TypeVar('T')
+
+
+def random_edges(n: int, m: int, rng: random.Random) -> list[tuple[int, int]]:
+    """
+    정점 1..n 사이의 균일한 무작위 간선 m개
+    """
+    return [(rng.randint(1, n), rng.randint(1, n)) for _ in range(m)]
+
+
+def power_law_edges(n: int, m: int, rng: random.Random) -> list[tuple[int, int]]:
+    """
+    선호적 연결(Barabasi-Albert) 방식의 간선 약 m개 (차수 분포가 멱법칙)
+    새 정점마다 k = m // n개의 간선을 차수에 비례한 확률로 기존 정점에 연결
+    """
+    k = max(1, m // n)
+
+    # every edge endpoint once, so a uniform pick is degree-proportional
+    ends = list(range(1, k + 1))
+    edges: list[tuple[int, int]] = []
+    for v in range(k + 1, n + 1):
+        for _ in range(k):
+            u = rng.choice(ends)
+            edges.append((v, u))
+            ends.append(u)
+        ends.extend([v] * k)
+
+    return edges
+
+
+def dag_edges(n: int, m: int, rng: random.Random) -> list[tuple[int, int]]:
+    """
+    사이클이 없는 무작위 방향 간선 m개
+    (무작위 순열 순서에서 앞 정점 -> 뒤 정점으로만 연결)
+    """
+    rank = list(range(1, n + 1))
+    rng.shuffle(rank)
+
+    edges: list[tuple[int, int]] = []
+    for _ in range(m):
+        u, v = rng.randrange(n), rng.randrange(n)
+        if u != v:
+            edges.append((rank[min(u, v)], rank[max(u, v)]))
+
+    return edges
+
+
+def timed(func: Callable[[], T]) -> tuple[float, T]:
+    """
+    func()를 한 번 실행하고 (걸린 시간(초), 결과)를 반환
+    """
+    start = perf_counter()
+    result = func()
+    return perf_counter() - start, result
+
+
+def traced(func: Callable[[], T]) -> tuple[int, T]:
+    """
+    func()를 실행하고 (실행 후 남아 있는 할당량(바이트), 결과)를 반환
+    """
+    tracemalloc.start()
+    try:
+        result = func()
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return size, result
+
+
+def bench_csr(n: int, m: int) -> None:
+    """
+    list-of-lists 인접 리스트와 CSR의 메모리, dfs(1)+bfs(1) 시간 비교
+    """
+    edges = random_edges(n, m, random.Random(1))
+
+    def build_lists() -> Graph:
+        graph = Graph(n)
+        for u, v in edges:
+            graph.add_edge(u, v)
+        return graph
+
+    results: list[list[int]] = []
+    for name, build in (("lists", build_lists), ("csr", lambda: Graph.from_edges(n, edges))):
+        size, graph = traced(build)
+        elapsed, paths = timed(lambda: graph.dfs(1) + graph.bfs(1))
+        print(f"csr {name:<8} {size / 2**20:8.1f} MiB  dfs+bfs {elapsed:6.2f}s")
+
+        if results and paths != results[0]:
+            raise AssertionError(f"{name} traversal differs from lists")
+        results.append(paths)
+
+
+def bench_direction(n: int, m: int) -> None:
+    """
+    멱법칙 그래프에서 bfs(1)의 모드별 시간 비교
+    ("direction"은 레벨 안의 순서가 다르므로 방문한 정점 집합만 비교)
+    """
+    graph = Graph.from_edges(n, power_law_edges(n, m, random.Random(3)))
+
+    # warm up (the first "numpy" call also pays for the lazy import)
+    Graph.from_edges(2, [(1, 2)]).bfs(1, mode="numpy")
+
+    expected: list[int] | None = None
+    for mode in ("queue", "direction", "numpy"):
+        elapsed, path = timed(lambda: graph.bfs(1, mode=mode))
+        print(f"direction {mode:<10} {elapsed:6.2f}s  visited {len(path)}")
+
+        if expected is None:
+            expected = sorted(path)
+        elif sorted(path) != expected:
+            raise AssertionError(f"bfs mode {mode} visits different vertices")
+
+
+def bench_weighted(n: int, m: int) -> None:
+    """
+    dijkstra(1)(가중치 1..100)와 0/1 가중치 그래프에서의 dijkstra(1),
+    zero_one_bfs(1) 처리량 비교 (0/1 그래프에서는 두 결과가 같아야 함)
+    """
+    rng = random.Random(9)
+    edges = random_edges(n, m, rng)
+
+    # undirected edges are relaxed from both ends
+    relaxed = 2 * m
+
+    graph = Graph.from_edges(n, edges, [rng.randint(1, 100) for _ in range(m)])
+    elapsed, _ = timed(lambda: graph.dijkstra(1))
+    print(f"weighted {'dijkstra(1..100)':<16} {elapsed:6.2f}s  {relaxed / elapsed / 1e6:5.2f}M edges/s")
+
+    graph = Graph.from_edges(n, edges, [rng.randint(0, 1) for _ in range(m)])
+    expected: array[int] | None = None
+    for name, search in (("dijkstra(0/1)", graph.dijkstra), ("zero_one_bfs", graph.zero_one_bfs)):
+        elapsed, dist = timed(lambda: search(1))
+        print(f"weighted {name:<16} {elapsed:6.2f}s  {relaxed / elapsed / 1e6:5.2f}M edges/s")
+
+        if expected is None:
+            expected = dist
+        elif dist != expected:
+            raise AssertionError(f"{name} distances differ from dijkstra")
+
+
+def bench_directed(n: int, m: int) -> None:
+    """
+    DAG에서 topological_sort 시간과 순서의 유효성,
+    DAG(모든 요소가 정점 하나)와 무작위 방향 그래프에서 strongly_connected_components 시간
+    """
+    rng = random.Random(14)
+    edges = dag_edges(n, m, rng)
+    dag = Graph.from_edges(n, edges, directed=True)
+
+    elapsed, order = timed(dag.topological_sort)
+    print(f"directed {'topological_sort':<16} {elapsed:6.2f}s  {len(order)} vertices")
+
+    position = [0] * (n + 1)
+    for i, v in enumerate(order):
+        position[v] = i
+    if any(position[u] >= position[v] for u, v in edges):
+        raise AssertionError("topological order puts an edge backwards")
+
+    elapsed, components = timed(dag.strongly_connected_components)
+    print(f"directed {'scc(dag)':<16} {elapsed:6.2f}s  {len(components)} components")
+    if len(components) != n:
+        raise AssertionError("a DAG must have only single-vertex components")
+
+    graph = Graph.from_edges(n, random_edges(n, m, rng), directed=True)
+    elapsed, components = timed(graph.strongly_connected_components)
+    print(f"directed {'scc(random)':<16} {elapsed:6.2f}s  {len(components)} components")
+    if sum(map(len, components)) != n:
+        raise AssertionError("components do not partition the vertices")
+
+
+# suite -> (benchmark, default n, default m)
+SUITES: dict[str, tuple[Callable[[int, int], None], int, int]] = {
+    "csr": (bench_csr, 200_000, 1_000_000),
+    "direction": (bench_direction, 200_000, 1_600_000),
+    "weighted": (bench_weighted, 200_000, 1_000_000),
+    "directed": (bench_directed, 1_000_000, 2_000_000),
+}
+
+
+def main() -> None:
+    if len(sys.argv) > 4 or (len(sys.argv) >= 2 and sys.argv[1] not in (*SUITES, "all")):
+        print(f"usage: python bench.py [{'|'.join(SUITES)}|all] [n] [m]")
+        sys.exit(1)
+
+    suite = sys.argv[1] if len(sys.argv) >= 2 else "all"
+    names = list(SUITES) if suite == "all" else [suite]
+
+    for name in names:
+        bench, n, m = SUITES[name]
+        if len(sys.argv) >= 3:
+            n = int(sys.argv[2])
+        if len(sys.argv) == 4:
+            m = int(sys.argv[3])
+        bench(n, m)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,45 @@
 from __future__ import annotations
+from array import array
 from collections import deque
+from dataclasses import dataclass, field
+from heapq import heappop, heappush
+from importlib import import_module
+from itertools import islice
+from mmap import ACCESS_READ, mmap as MemoryMap
+from time import perf_counter
+from typing import IO, Any, Callable, Iterable, Iterator, Literal, TextIO, TypeAlias
+import os
+import struct
+import sys
+
+
+# direction-optimizing BFS heuristics (Beamer et al.)
+# top-down -> bottom-up when frontier edges > unexplored edges / ALPHA
+# bottom-up -> top-down when frontier vertices < n / BETA
+BFS_ALPHA = 14
+BFS_BETA = 24
+
+# bytes read at a time by Graph.load_edges
+LOAD_CHUNK_SIZE = 1 << 20
+
+# vertices formatted per write by write_path
+PRINT_CHUNK_SIZE = 1 << 12
+
+# binary snapshot layout (little-endian), see Graph.save
+#   header: magic, version, flags, n, number of CSR entries (32 bytes)
+#   offsets: int32 * (n + 1), targets: int32 * entries
+#   weights: int64 * entries (only with SNAPSHOT_WEIGHTED, 8-byte aligned)
+SNAPSHOT_MAGIC = b'GRPH'
+SNAPSHOT_VERSION = 1
+SNAPSHOT_WEIGHTED = 1 << 0
+SNAPSHOT_DIRECTED = 1 << 1
+SNAPSHOT_HEADER = struct.Struct('<4sIIQQ4x')
+
+# CSR buffer: an owned array, or a zero-copy view over a mapped snapshot
+IntBuffer: TypeAlias = "array[int] | memoryview"
+
+# set this environment variable (e.g. GRAPH_PROFILE=1) to profile every Graph
+PROFILE_ENV = "GRAPH_PROFILE"
 
 
 """
@@ -11,98 +51,1125 @@ TODO:
 """
 
 
+@dataclass
+class TraversalStats:
+    """
+    Graph 탐색 계측 결과 (Graph.stats에 설정하면 기록됨)
+    """
+    # vertices yielded and adjacency entries scanned by dfs/bfs
+    vertices_visited: int = 0
+    edges_scanned: int = 0
+
+    # largest DFS stack / BFS queue seen
+    max_frontier: int = 0
+
+    # wall time per phase: "sort", "traverse", "format"
+    phase_seconds: dict[str, float] = field(default_factory=dict)
+
+    def add_phase(self, phase: str, seconds: float) -> None:
+        """phase에 걸린 시간을 누적합니다."""
+        self.phase_seconds[phase] = self.phase_seconds.get(phase, 0.0) + seconds
+
+    def report(self) -> str:
+        """사람이 읽을 수 있는 요약을 반환합니다."""
+        phases = ' '.join(
+            f"{phase}={seconds:.6f}s" for phase, seconds in self.phase_seconds.items()
+        )
+        return (
+            f"[graph] vertices={self.vertices_visited} "
+            f"edges={self.edges_scanned} max_frontier={self.max_frontier}\n"
+            f"[graph] {phases}"
+        )
+
+
 class Graph:
-    def __init__(self, n: int) -> None:
+    def __init__(self, n: int, directed: bool = False) -> None:
         """
         그래프 초기화
         n: 정점의 개수 (1번부터 n번까지) (0-based)
+        directed: True면 add_edge(u, v)가 u -> v 방향으로만 간선을 추가
         """
         self.n = n
+        self.directed = directed
         self.edge: list[list[int]] = [[] for _ in range(n)]
-    
-    def add_edge(self, u: int, v: int) -> None:
+
+        # optional edge weights, parallel to edge (None: every weight is 1)
+        self.weight: list[list[int]] | None = None
+
+        # compact CSR (compressed sparse row) storage
+        # neighbors of v are targets[offsets[v]:offsets[v + 1]] (ascending)
+        # - frozen: the only copy of the adjacency (edge is released)
+        # - otherwise: a sorted cache of edge, dropped by add_edge
+        # array('i') buffers, or memoryviews over a snapshot (see load)
+        self._csr: tuple[IntBuffer, IntBuffer] | None = None
+        self._frozen = False
+
+        # weights of the CSR rows, parallel to targets (None: unweighted)
+        self._weights: IntBuffer | None = None
+
+        # generation-stamped visited buffer shared by every traversal
+        # vertex v is visited in the current traversal iff seen[v] == generation
+        self._seen: list[int] = []
+        self._generation = 0
+
+        # union-find over the vertices (path compression + union by rank)
+        # built on the first component query, then kept up to date by add_edge
+        self._parent: list[int] | None = None
+        self._rank: list[int] = []
+        self._size: list[int] = []
+
+        # opt-in instrumentation (None: disabled, no per-edge overhead)
+        self.stats: TraversalStats | None = (
+            TraversalStats() if os.environ.get(PROFILE_ENV) else None
+        )
+
+    @classmethod
+    def from_edges(
+        cls,
+        n: int,
+        edges: Iterable[tuple[int, int]],
+        weights: Iterable[int] | None = None,
+        directed: bool = False
+    ) -> Graph:
+        """
+        간선 목록으로부터 CSR 형태로 고정된(frozen) 그래프를 바로 생성
+        (list-of-lists 인접 리스트를 거치지 않음)
+        weights: 각 간선의 가중치 (생략하면 가중치 없는 그래프, 개수가 간선 수와 다르면 ValueError)
+        directed: 방향 그래프 여부
+        """
+        # endpoints of each edge (1-based)
+        us: array[int] = array('i')
+        vs: array[int] = array('i')
+        for u, v in edges:
+            us.append(u)
+            vs.append(v)
+
+        ws = None if weights is None else array('q', weights)
+        if ws is not None and len(ws) != len(us):
+            raise ValueError(f"expected {len(us)} weights, got {len(ws)}")
+        return cls._from_endpoints(n, us, vs, ws, directed)
+
+    @classmethod
+    def load_edges(
+        cls,
+        stream: IO[bytes] | MemoryMap,
+        n: int,
+        m: int,
+        weighted: bool = False,
+        directed: bool = False
+    ) -> Graph:
+        """
+        바이너리 스트림(sys.stdin.buffer, 파일, mmap 등)에서 "u v" 간선 m개를
+        LOAD_CHUNK_SIZE 바이트씩 읽어 CSR 형태로 고정된 그래프를 생성
+        (줄 단위 문자열 리스트를 만들지 않음)
+        weighted: 간선이 "u v w" 형식인지 여부
+        directed: 방향 그래프 여부
+        """
+        # all numbers, interleaved as u0 v0 (w0) u1 v1 (w1) ...
+        tokens: array[int] = array('q')
+        step = 3 if weighted else 2
+        need = step * m
+
+        # bytes of a number cut off at the end of the previous chunk
+        carry = b''
+        while len(tokens) < need:
+            chunk = stream.read(LOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+
+            chunk = carry + chunk
+            cut = max(chunk.rfind(b' '), chunk.rfind(b'\n')) + 1
+            carry = chunk[cut:]
+            tokens.extend(map(int, chunk[:cut].split()))
+
+        if carry:
+            tokens.extend(map(int, carry.split()))
+
+        if len(tokens) < need:
+            raise ValueError(f"expected {m} edges, got {len(tokens) // step}")
+
+        us = array('i', tokens[0:need:step])
+        vs = array('i', tokens[1:need:step])
+        ws = tokens[2:need:step] if weighted else None
+        return cls._from_endpoints(n, us, vs, ws, directed)
+
+    @classmethod
+    def _from_endpoints(
+        cls,
+        n: int,
+        us: array[int],
+        vs: array[int],
+        ws: array[int] | None = None,
+        directed: bool = False
+    ) -> Graph:
         """
-        양방향 간선 추가
+        간선 (us[i], vs[i]) (1-based, 가중치 ws[i])로부터 counting sort로
+        CSR을 직접 생성
         """
+        # skip allocating n empty adjacency lists
+        graph = cls(0, directed)
+        graph.n = n
+
+        # count the degree of each vertex (offsets[v] is the slot of v - 1)
+        offsets: array[int] = array('i', [0]) * (n + 1)
+        for u in us:
+            offsets[u] += 1
+        if not directed:
+            for v in vs:
+                offsets[v] += 1
+
+        # prefix sum -> start offset of each adjacency row
+        for i in range(n):
+            offsets[i + 1] += offsets[i]
+
+        # scatter each edge into its row (both directions if undirected)
+        targets: array[int] = array('i', [0]) * offsets[n]
+        fill = offsets[:-1]
+        for u, v in zip(us, vs):
+            u -= 1
+            v -= 1
+            targets[fill[u]] = v
+            fill[u] += 1
+            if not directed:
+                targets[fill[v]] = u
+                fill[v] += 1
+
+        # scatter the weights the same way
+        weights: array[int] | None = None
+        if ws is not None:
+            weights = array('q', [0]) * offsets[n]
+            fill = offsets[:-1]
+            for u, v, w in zip(us, vs, ws):
+                weights[fill[u - 1]] = w
+                fill[u - 1] += 1
+                if not directed:
+                    weights[fill[v - 1]] = w
+                    fill[v - 1] += 1
+
+        # visit the smallest vertex first
+        for i in range(n):
+            lo, hi = offsets[i], offsets[i + 1]
+            if hi - lo > 1:
+                if weights is None:
+                    targets[lo:hi] = array('i', sorted(targets[lo:hi]))
+                else:
+                    row = sorted(zip(targets[lo:hi], weights[lo:hi]))
+                    targets[lo:hi] = array('i', [t for t, _ in row])
+                    weights[lo:hi] = array('q', [w for _, w in row])
+
+        graph._csr = (offsets, targets)
+        graph._weights = weights
+        graph._frozen = True
+        return graph
+
+    def save(self, path: str) -> None:
+        """
+        CSR 형태를 버전이 붙은 바이너리 스냅샷 파일로 저장
+        (Graph.load로 텍스트 파싱 없이 다시 열 수 있음)
+        """
+        offsets, targets = self._packed()
+        weights = self._weights
+        flags = SNAPSHOT_WEIGHTED if weights is not None else 0
+        if self.directed:
+            flags |= SNAPSHOT_DIRECTED
+
+        sections: list[IntBuffer] = [offsets, targets]
+        if weights is not None:
+            sections.append(weights)
+
+        with open(path, 'wb') as f:
+            f.write(SNAPSHOT_HEADER.pack(
+                SNAPSHOT_MAGIC, SNAPSHOT_VERSION, flags, self.n, len(targets)
+            ))
+
+            pos = SNAPSHOT_HEADER.size
+            for section, typecode in zip(sections, 'iiq'):
+                # weights start on an 8-byte boundary
+                if typecode == 'q' and pos % 8:
+                    f.write(bytes(8 - pos % 8))
+                    pos += 8 - pos % 8
+
+                if sys.byteorder == 'little':
+                    f.write(section)
+                else:
+                    swapped = array(typecode, section)
+                    swapped.byteswap()
+                    f.write(swapped)
+                pos += len(section) * array(typecode).itemsize
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> Graph:
+        """
+        Graph.save로 저장한 스냅샷을 CSR 형태로 고정된 그래프로 불러옴
+        mmap: True면 파일을 메모리 매핑하고 dfs/bfs가 매핑된 버퍼를 복사 없이 읽음
+              False면 파일 내용을 array('i')로 복사
+        """
+        with open(path, 'rb') as f:
+            if mmap:
+                buffer = memoryview(MemoryMap(f.fileno(), 0, access=ACCESS_READ))
+            else:
+                buffer = memoryview(f.read())
+
+        if len(buffer) < SNAPSHOT_HEADER.size:
+            raise ValueError(f"truncated graph snapshot: {path}")
+        magic, version, flags, n, entries = SNAPSHOT_HEADER.unpack_from(buffer)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError(f"not a graph snapshot: {path}")
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(f"unsupported graph snapshot version: {version}")
+
+        layout: list[tuple[Literal['i', 'q'], int]] = [
+            ('i', n + 1), ('i', entries), ('q', entries)
+        ]
+
+        pos = SNAPSHOT_HEADER.size
+        sections: list[IntBuffer] = []
+        for typecode, count in layout:
+            if typecode == 'q':
+                if not flags & SNAPSHOT_WEIGHTED:
+                    break
+                pos += -pos % 8
+
+            size = count * array(typecode).itemsize
+            view = buffer[pos:pos + size]
+            if len(view) != size:
+                raise ValueError(f"truncated graph snapshot: {path}")
+            pos += size
+
+            # zero-copy view when the byte order matches, otherwise a copy
+            if mmap and sys.byteorder == 'little':
+                sections.append(view.cast(typecode))
+            else:
+                data = array(typecode, view.tobytes())
+                if sys.byteorder != 'little':
+                    data.byteswap()
+                sections.append(data)
+
+        # skip allocating n empty adjacency lists
+        graph = cls(0, bool(flags & SNAPSHOT_DIRECTED))
+        graph.n = n
+        graph._csr = (sections[0], sections[1])
+        graph._weights = sections[2] if len(sections) == 3 else None
+        graph._frozen = True
+        return graph
+
+    @property
+    def frozen(self) -> bool:
+        """
+        인접 리스트가 CSR 형태로 고정되어 있는지 여부
+        """
+        return self._frozen
+
+    def _packed(self) -> tuple[IntBuffer, IntBuffer]:
+        """
+        오름차순으로 정렬된 CSR 인접 리스트를 반환
+        (한 번만 만들어 캐시하고, add_edge가 캐시를 무효화함)
+        """
+        if self._csr is None:
+            offsets: array[int] = array('i', [0])
+            targets: array[int] = array('i')
+            weight = self.weight
+
+            if weight is None:
+                for adj in self.edge:
+                    # visit the smallest vertex first
+                    targets.extend(sorted(adj))
+                    offsets.append(len(targets))
+            else:
+                # sort (target, weight) pairs so the weights follow their edges
+                weights: array[int] = array('q')
+                for adj, wts in zip(self.edge, weight):
+                    row = sorted(zip(adj, wts))
+                    targets.extend([t for t, _ in row])
+                    weights.extend([w for _, w in row])
+                    offsets.append(len(targets))
+
+                self._weights = weights
+
+            self._csr = (offsets, targets)
+
+        return self._csr
+
+    def freeze(self) -> None:
+        """
+        인접 리스트를 두 개의 array('i') 버퍼(offsets, targets)로 압축
+        이후 dfs/bfs는 압축된 형태 위에서 수행됨
+        """
+        if self._frozen:
+            return
+
+        self._packed()
+
+        # release the list-of-lists storage
+        self.edge = []
+        self.weight = None
+        self._frozen = True
+
+    def _thaw(self) -> None:
+        """
+        CSR 형태를 다시 list-of-lists 인접 리스트로 복원
+        """
+        if not self._frozen:
+            return
+
+        offsets, targets = self._packed()
+        self.edge = [
+            list(targets[offsets[i]:offsets[i + 1]]) for i in range(self.n)
+        ]
+
+        weights = self._weights
+        if weights is not None:
+            self.weight = [
+                list(weights[offsets[i]:offsets[i + 1]]) for i in range(self.n)
+            ]
+
+        # drop any snapshot views, the lists are the adjacency now
+        self._csr = None
+        self._weights = None
+
+        self._frozen = False
+
+    def add_edge(self, u: int, v: int, w: int | None = None) -> None:
+        """
+        양방향 간선 추가 (방향 그래프면 u -> v 간선만 추가)
+        w: 간선 가중치 (생략하면 1, 처음 주어질 때 가중치 저장 공간을 만듦)
+        """
+        # a frozen graph becomes mutable again
+        if self._frozen:
+            self._thaw()
+
+        # existing edges get weight 1 once the graph becomes weighted
+        if w is not None and self.weight is None:
+            self.weight = [[1] * len(adj) for adj in self.edge]
+        weight = self.weight
+
         self.edge[u - 1].append(v - 1)
-        self.edge[v - 1].append(u - 1)
-        pass
-    
-    def dfs(self, start: int) -> list[int]:
+        if weight is not None:
+            weight[u - 1].append(1 if w is None else w)
+
+        if not self.directed:
+            self.edge[v - 1].append(u - 1)
+            if weight is not None:
+                weight[v - 1].append(1 if w is None else w)
+
+        # the sorted adjacency is stale now
+        self._csr = None
+        self._weights = None
+
+        # keep the component index in sync
+        if self._parent is not None:
+            self._union(u - 1, v - 1)
+
+    def _components(self) -> list[int]:
+        """
+        union-find의 parent 배열을 반환 (없으면 모든 간선으로 한 번 생성)
+        """
+        if self._parent is None:
+            self._parent = list(range(self.n))
+            self._rank = [0] * self.n
+            self._size = [1] * self.n
+
+            # undirected edges are stored in both rows, union them once
+            offsets, targets = self._packed()
+            for u in range(self.n):
+                for i in range(offsets[u], offsets[u + 1]):
+                    if self.directed or u < targets[i]:
+                        self._union(u, targets[i])
+
+        return self._parent
+
+    def _find(self, x: int) -> int:
+        """
+        x(0-based)가 속한 집합의 대표 정점을 찾고 경로를 압축
+        """
+        parent = self._parent
+        assert parent is not None
+
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+
+        # path compression: point every vertex on the path at the root
+        while parent[x] != root:
+            parent[x], x = root, parent[x]
+
+        return root
+
+    def _union(self, u: int, v: int) -> None:
+        """
+        u, v(0-based)가 속한 두 집합을 합침 (union by rank)
+        """
+        parent = self._parent
+        assert parent is not None
+
+        ru, rv = self._find(u), self._find(v)
+        if ru == rv:
+            return
+
+        # attach the shallower tree below the deeper one
+        rank = self._rank
+        if rank[ru] < rank[rv]:
+            ru, rv = rv, ru
+        elif rank[ru] == rank[rv]:
+            rank[ru] += 1
+
+        parent[rv] = ru
+        self._size[ru] += self._size[rv]
+
+    def connected(self, u: int, v: int) -> bool:
+        """
+        두 정점 u, v가 같은 연결 요소에 있는지 여부 (탐색 없이 union-find로 판정)
+        (방향 그래프에서는 방향을 무시한 약한 연결 요소 기준)
+        """
+        self._components()
+        return self._find(u - 1) == self._find(v - 1)
+
+    def component_sizes(self) -> list[int]:
+        """
+        각 연결 요소의 정점 수
+        (연결 요소 안의 가장 작은 정점 번호 순서)
+        """
+        self._components()
+
+        sizes: list[int] = []
+        counted = bytearray(self.n)
+        for v in range(self.n):
+            root = self._find(v)
+            if not counted[root]:
+                counted[root] = 1
+                sizes.append(self._size[root])
+
+        return sizes
+
+    def _next_generation(self) -> tuple[list[int], int]:
+        """
+        방문 표시 버퍼와 새 세대(generation) 번호를 반환
+        (탐색마다 [False] * n을 새로 할당하지 않음)
+        끝까지 한 번에 실행되는 탐색에서만 사용 (제너레이터는 중간에 다른 탐색이
+        끼어들 수 있으므로 자체 방문 배열을 사용)
+        """
+        if len(self._seen) != self.n:
+            self._seen = [0] * self.n
+            self._generation = 0
+
+        self._generation += 1
+        return self._seen, self._generation
+
+    def dfs(
+        self,
+        start: int,
+        mode: str = "stack",
+        on_stack_peak: Callable[[int], None] | None = None
+    ) -> list[int]:
         """
         깊이 우선 탐색 (DFS)
         
         [구현 방법] 스택 방식: 명시적 스택을 사용하여 반복문으로 구현
+
+        mode, on_stack_peak: iter_dfs 참고
         """
-        # dfs path to return
-        path: list[int] = []
+        stats = self.stats
+        if stats is not None:
+            return self._profiled(
+                stats,
+                lambda hook: self.iter_dfs(start, mode, hook),
+                on_stack_peak
+            )
 
-        # visit the smallest vertex first
-        for i in range(len(self.edge)):
-            self.edge[i].sort(reverse=True)
-        
-        # array to check if the i-th vertex is visited
-        visited = [False] * self.n
+        # return the dfs path order
+        return list(self.iter_dfs(start, mode, on_stack_peak))
+
+    def iter_dfs(
+        self,
+        start: int,
+        mode: str = "stack",
+        on_stack_peak: Callable[[int], None] | None = None
+    ) -> Iterator[int]:
+        """
+        DFS 방문 순서대로 정점을 하나씩 내보내는 제너레이터
+        (경로 전체를 만들지 않으므로 중간에 멈출 수 있음)
+
+        mode:
+        - "stack": 방문하지 않은 이웃을 모두 스택에 넣는 방식 (스택 최대 O(E))
+        - "index": (정점, 다음에 볼 이웃 위치) 스택 방식 (스택 최대 O(V))
+        두 방식의 방문 순서는 같음
+        on_stack_peak: 탐색이 끝나면 스택의 최대 크기를 넘겨 받는 콜백
+        """
+        if mode == "index":
+            return self._iter_dfs_index(start, on_stack_peak)
+        if mode != "stack":
+            raise ValueError(f"unknown dfs mode: {mode}")
+
+        return self._iter_dfs_stack(start, on_stack_peak)
+
+    def _iter_dfs_stack(
+        self,
+        start: int,
+        on_stack_peak: Callable[[int], None] | None
+    ) -> Iterator[int]:
+        """
+        이웃을 모두 스택에 넣는 DFS (꺼낼 때 방문 여부를 확인)
+        """
+        # neighbors are sorted once and shared by every traversal
+        offsets, targets = self._packed()
+
+        # private visited flags, so suspended iterators never interfere
+        visited = bytearray(self.n)
 
         # dfs via stack
         stack = [start - 1]
+        peak = 1
         while stack:
             # visit the next vertex
             top = stack.pop()
             
             # defensive coding
             if not visited[top]:
-                visited[top] = True
-                path.append(top + 1)
+                visited[top] = 1
+                yield top + 1
 
-                # add vertices to the stack
-                for neighbor in self.edge[top]:
+                # push from the back of the row so the smallest is popped first
+                for i in range(offsets[top + 1] - 1, offsets[top] - 1, -1):
+                    neighbor = targets[i]
                     if not visited[neighbor]:
                         stack.append(neighbor)
-        
-        # return the dfs path order
-        return path
+
+                if len(stack) > peak:
+                    peak = len(stack)
+
+        if on_stack_peak is not None:
+            on_stack_peak(peak)
+
+    def _iter_dfs_index(
+        self,
+        start: int,
+        on_stack_peak: Callable[[int], None] | None
+    ) -> Iterator[int]:
+        """
+        (정점, 다음에 볼 이웃의 CSR 위치) 스택을 사용하는 DFS
+        스택에는 현재 경로 위의 정점만 있으므로 크기가 O(V)로 제한됨
+        """
+        offsets, targets = self._packed()
+        visited = bytearray(self.n)
+
+        visited[start - 1] = 1
+        yield start
+
+        # vertices on the current path and the next row position of each
+        vertices = [start - 1]
+        cursors = [offsets[start - 1]]
+        peak = 1
+        while vertices:
+            top = vertices[-1]
+            i = cursors[-1]
+            end = offsets[top + 1]
+
+            # skip neighbors visited since top was entered
+            while i < end and visited[targets[i]]:
+                i += 1
+
+            # top is finished, backtrack
+            if i == end:
+                vertices.pop()
+                cursors.pop()
+                continue
+
+            # resume top after this neighbor, and descend into it
+            cursors[-1] = i + 1
+            neighbor = targets[i]
+            visited[neighbor] = 1
+            yield neighbor + 1
+
+            vertices.append(neighbor)
+            cursors.append(offsets[neighbor])
+            if len(vertices) > peak:
+                peak = len(vertices)
+
+        if on_stack_peak is not None:
+            on_stack_peak(peak)
     
-    def bfs(self, start: int) -> list[int]:
+    def bfs(
+        self,
+        start: int,
+        mode: str = "queue",
+        on_queue_peak: Callable[[int], None] | None = None
+    ) -> list[int]:
         """
         너비 우선 탐색 (BFS)
         큐를 사용하여 구현
+
+        mode:
+        - "queue": 큐 기반 BFS (작은 번호의 이웃부터 방문한 순서)
+        - "direction": 레벨 단위로 top-down/bottom-up 확장을 전환하는 BFS
+          (레벨은 같지만, 각 레벨 안에서는 정점 번호 오름차순)
+        - "numpy": 프런티어 전체를 NumPy 배열 연산으로 한 번에 확장하는 BFS
+          ("queue"와 같은 방문 순서, NumPy 필요)
+        on_queue_peak: iter_bfs 참고 ("queue" 방식에서만 사용)
         """
-        # bfs path to return
-        path: list[int] = []
+        if mode == "direction":
+            return self._bfs_direction_optimizing(start)
+        if mode == "numpy":
+            return self._bfs_numpy(start)
+        if mode != "queue":
+            raise ValueError(f"unknown bfs mode: {mode}")
 
-        # visit the smallest vertex first
-        for i in range(len(self.edge)):
-            self.edge[i].sort()
+        stats = self.stats
+        if stats is not None:
+            return self._profiled(
+                stats,
+                lambda hook: self.iter_bfs(start, hook),
+                on_queue_peak
+            )
 
-        # array to check if the i-th vertex is visited
-        visited = [False] * self.n
+        # return the bfs path order
+        return list(self.iter_bfs(start, on_queue_peak))
+
+    def iter_bfs(
+        self,
+        start: int,
+        on_queue_peak: Callable[[int], None] | None = None
+    ) -> Iterator[int]:
+        """
+        BFS(큐 방식) 방문 순서대로 정점을 하나씩 내보내는 제너레이터
+        (경로 전체를 만들지 않으므로 중간에 멈출 수 있음)
+        on_queue_peak: 탐색이 끝나면 큐의 최대 크기를 넘겨 받는 콜백
+        """
+        # neighbors are sorted once and shared by every traversal
+        offsets, targets = self._packed()
+
+        # private visited flags, so suspended iterators never interfere
+        visited = bytearray(self.n)
 
         # set initial value
-        path.append(start)
-        visited[start - 1] = True
+        visited[start - 1] = 1
+        yield start
         dq:deque[int] = deque([start - 1])
 
         # bfs via queue
+        peak = 1
         while dq:
             top = dq.popleft()
             
-            # append neighbors to the queue
-            for neighbor in self.edge[top]:
+            # append neighbors to the queue (rows are already ascending)
+            for neighbor in targets[offsets[top]:offsets[top + 1]]:
                 if not visited[neighbor]:
-                    visited[neighbor] = True
-                    path.append(neighbor + 1)
+                    visited[neighbor] = 1
+                    yield neighbor + 1
                     dq.append(neighbor)
 
-        # return the bfs path order
+            if len(dq) > peak:
+                peak = len(dq)
+
+        if on_queue_peak is not None:
+            on_queue_peak(peak)
+
+    def _profiled(
+        self,
+        stats: TraversalStats,
+        traverse: Callable[[Callable[[int], None]], Iterator[int]],
+        on_peak: Callable[[int], None] | None
+    ) -> list[int]:
+        """
+        traverse(peak 콜백)가 만든 탐색을 끝까지 실행하면서 stats에 기록
+        """
+        started = perf_counter()
+        offsets, _ = self._packed()
+        sorted_at = perf_counter()
+
+        peaks: list[int] = []
+        path = list(traverse(peaks.append))
+        finished = perf_counter()
+
+        stats.add_phase("sort", sorted_at - started)
+        stats.add_phase("traverse", finished - sorted_at)
+        stats.vertices_visited += len(path)
+
+        # every visited vertex has its whole row scanned exactly once
+        for v in path:
+            stats.edges_scanned += offsets[v] - offsets[v - 1]
+
+        stats.max_frontier = max(stats.max_frontier, peaks[0])
+        if on_peak is not None:
+            on_peak(peaks[0])
+
         return path
-    
-    def search_and_print(self, start: int) -> None:
+
+    def _bfs_direction_optimizing(self, start: int) -> list[int]:
+        """
+        방향 최적화(direction-optimizing) BFS
+        프런티어가 크면 방문하지 않은 정점에서 프런티어 쪽 간선을 찾고 (bottom-up),
+        작으면 프런티어에서 이웃으로 확장 (top-down)
+        """
+        offsets, targets = self._packed()
+        n = self.n
+
+        # level of each vertex (-1: not visited yet)
+        level = [-1] * n
+        level[start - 1] = 0
+
+        path: list[int] = [start]
+        frontier: list[int] = [start - 1]
+        unvisited: list[int] = [v for v in range(n) if v != start - 1]
+
+        # edges incident to vertices not visited yet
+        unexplored_edges = len(targets) - (offsets[start] - offsets[start - 1])
+        bottom_up = False
+        depth = 0
+
+        while frontier:
+            frontier_edges = 0
+            for v in frontier:
+                frontier_edges += offsets[v + 1] - offsets[v]
+
+            # choose the expansion direction for this level
+            # (bottom-up needs in-edges, which only undirected rows provide)
+            if self.directed:
+                bottom_up = False
+            elif bottom_up:
+                bottom_up = len(frontier) * BFS_BETA >= n
+            else:
+                bottom_up = frontier_edges * BFS_ALPHA > unexplored_edges
+
+            next_frontier: list[int] = []
+            if bottom_up:
+                # drop vertices discovered since the last bottom-up step
+                unvisited = [v for v in unvisited if level[v] < 0]
+
+                # each unvisited vertex stops at its first neighbor in the frontier
+                for v in unvisited:
+                    for i in range(offsets[v], offsets[v + 1]):
+                        if level[targets[i]] == depth:
+                            next_frontier.append(v)
+                            break
+
+                for v in next_frontier:
+                    level[v] = depth + 1
+            else:
+                for v in frontier:
+                    for neighbor in targets[offsets[v]:offsets[v + 1]]:
+                        if level[neighbor] < 0:
+                            level[neighbor] = depth + 1
+                            next_frontier.append(neighbor)
+
+                # bottom-up produces ascending levels, keep top-down consistent
+                next_frontier.sort()
+
+            for v in next_frontier:
+                unexplored_edges -= offsets[v + 1] - offsets[v]
+                path.append(v + 1)
+
+            frontier = next_frontier
+            depth += 1
+
+        return path
+
+    def _bfs_numpy(self, start: int) -> list[int]:
+        """
+        NumPy로 벡터화한 BFS
+        프런티어를 인덱스 배열로 두고, CSR 행들을 한 번에 모아 다음 프런티어를 만듦
+        """
+        # lazy and untyped, so the default modes type-check without NumPy
+        np: Any = import_module("numpy")
+
+        offsets, targets = self._packed()
+
+        # zero-copy views over the array('i') buffers
+        off = np.frombuffer(offsets, dtype=np.intc)
+        tgt = np.frombuffer(targets, dtype=np.intc)
+
+        visited = np.zeros(self.n, dtype=np.bool_)
+        visited[start - 1] = True
+
+        # first[v]: earliest position of v among the scanned neighbors
+        first = np.empty(self.n, dtype=np.intp)
+
+        frontier = np.array([start - 1], dtype=np.intc)
+        levels = [frontier]
+
+        while frontier.size:
+            # rows of the frontier, concatenated in frontier order
+            row_start = off[frontier]
+            row_len = off[frontier + 1] - row_start
+            total = int(row_len.sum())
+            if total == 0:
+                break
+
+            # index of every scanned edge: row_start[j] + (position within row j)
+            shift = np.repeat(row_start - (np.cumsum(row_len) - row_len), row_len)
+            neighbors = tgt[shift + np.arange(total)]
+            neighbors = neighbors[~visited[neighbors]]
+
+            # the queue BFS discovers each vertex at its first occurrence
+            rank = np.arange(neighbors.size)
+            first[neighbors] = neighbors.size
+            np.minimum.at(first, neighbors, rank)
+            frontier = neighbors[first[neighbors] == rank]
+
+            visited[frontier] = True
+            levels.append(frontier)
+
+        path: list[int] = (np.concatenate(levels) + 1).tolist()
+        return path
+
+    def _bfs_distances(self, sources: list[int]) -> array[int]:
+        """
+        sources(0-based)를 거리 0으로 두고 BFS를 수행하여 거리 배열을 반환
+        도달할 수 없는 정점의 거리는 -1
+        """
+        offsets, targets = self._packed()
+        seen, gen = self._next_generation()
+        dist: array[int] = array('i', [-1]) * self.n
+
+        # the frontier list doubles as the queue (head index instead of popleft)
+        queue: list[int] = []
+        for src in sources:
+            if seen[src] != gen:
+                seen[src] = gen
+                dist[src] = 0
+                queue.append(src)
+
+        head = 0
+        while head < len(queue):
+            top = queue[head]
+            head += 1
+            next_dist = dist[top] + 1
+
+            for neighbor in targets[offsets[top]:offsets[top + 1]]:
+                if seen[neighbor] != gen:
+                    seen[neighbor] = gen
+                    dist[neighbor] = next_dist
+                    queue.append(neighbor)
+
+        return dist
+
+    def bfs_many(self, starts: Iterable[int]) -> list[array[int]]:
+        """
+        여러 시작 정점 각각에 대해 BFS를 수행
+        반환값의 i번째는 starts[i]로부터의 거리 배열 (0-based 인덱스, 도달 불가: -1)
+        """
+        # the sorted adjacency and the visited buffer are shared by all sources
+        return [self._bfs_distances([start - 1]) for start in starts]
+
+    def multi_source_bfs(self, starts: Iterable[int]) -> array[int]:
+        """
+        모든 시작 정점을 하나의 프런티어로 두고 BFS를 한 번만 수행
+        각 정점에서 가장 가까운 시작 정점까지의 거리 배열을 반환 (도달 불가: -1)
+        """
+        return self._bfs_distances([start - 1 for start in starts])
+
+    def _packed_weights(self) -> IntBuffer:
+        """
+        CSR targets와 평행한 가중치 배열 (가중치 없는 그래프는 모두 1)
+        """
+        _, targets = self._packed()
+        if self._weights is None:
+            return array('q', [1]) * len(targets)
+        return self._weights
+
+    def dijkstra(self, start: int) -> array[int]:
+        """
+        힙 기반 다익스트라 최단 경로
+        start로부터의 거리 배열을 반환 (0-based 인덱스, 도달 불가: -1)
+        """
+        offsets, targets = self._packed()
+        weights = self._packed_weights()
+        if weights and min(weights) < 0:
+            raise ValueError("dijkstra requires non-negative edge weights")
+
+        # -1: not reached yet
+        dist = [-1] * self.n
+        dist[start - 1] = 0
+        heap = [(0, start - 1)]
+
+        while heap:
+            d, top = heappop(heap)
+
+            # skip entries superseded by a shorter distance
+            if d > dist[top]:
+                continue
+
+            for i in range(offsets[top], offsets[top + 1]):
+                neighbor = targets[i]
+                nd = d + weights[i]
+                if dist[neighbor] < 0 or nd < dist[neighbor]:
+                    dist[neighbor] = nd
+                    heappush(heap, (nd, neighbor))
+
+        return array('q', dist)
+
+    def zero_one_bfs(self, start: int) -> array[int]:
+        """
+        가중치가 0 또는 1인 그래프의 최단 경로 (덱 기반 0-1 BFS)
+        start로부터의 거리 배열을 반환 (0-based 인덱스, 도달 불가: -1)
+        """
+        offsets, targets = self._packed()
+        weights = self._packed_weights()
+        if weights and (min(weights) < 0 or max(weights) > 1):
+            raise ValueError("zero_one_bfs requires edge weights of 0 or 1")
+
+        # -1: not reached yet
+        dist = [-1] * self.n
+        dist[start - 1] = 0
+        dq:deque[int] = deque([start - 1])
+
+        # the deque always holds at most two consecutive distances
+        while dq:
+            top = dq.popleft()
+            d = dist[top]
+
+            for i in range(offsets[top], offsets[top + 1]):
+                neighbor = targets[i]
+                w = weights[i]
+                nd = d + w
+                if dist[neighbor] < 0 or nd < dist[neighbor]:
+                    dist[neighbor] = nd
+                    # 0-weight edges stay on the current level
+                    if w == 0:
+                        dq.appendleft(neighbor)
+                    else:
+                        dq.append(neighbor)
+
+        return array('q', dist)
+
+    def topological_sort(self) -> list[int]:
+        """
+        방향 그래프의 위상 정렬 순서 (Kahn 알고리즘, 재귀 없음)
+        사이클이 있으면 ValueError
+        """
+        if not self.directed:
+            raise ValueError("topological_sort requires a directed graph")
+
+        offsets, targets = self._packed()
+
+        indegree = [0] * self.n
+        for v in targets:
+            indegree[v] += 1
+
+        # the order list doubles as the queue (head index instead of popleft)
+        order = [v for v in range(self.n) if indegree[v] == 0]
+        head = 0
+        while head < len(order):
+            top = order[head]
+            head += 1
+
+            for neighbor in targets[offsets[top]:offsets[top + 1]]:
+                indegree[neighbor] -= 1
+                if indegree[neighbor] == 0:
+                    order.append(neighbor)
+
+        # vertices on a cycle never reach indegree 0
+        if len(order) != self.n:
+            raise ValueError("graph has a cycle")
+
+        return [v + 1 for v in order]
+
+    def strongly_connected_components(self) -> list[list[int]]:
+        """
+        강한 연결 요소 목록 (Tarjan 알고리즘, 명시적 스택으로 재귀 없이 구현)
+        요소들은 응축 그래프의 역위상 순서로 반환됨
+        (무방향 그래프에서는 연결 요소와 같음)
+        """
+        offsets, targets = self._packed()
+        n = self.n
+
+        # discovery index and lowest reachable index of each vertex (-1: new)
+        index = [-1] * n
+        low = [0] * n
+        counter = 0
+
+        # vertices of components not emitted yet
+        stack: list[int] = []
+        on_stack = bytearray(n)
+
+        components: list[list[int]] = []
+        for root in range(n):
+            if index[root] != -1:
+                continue
+
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = 1
+
+            # simulated call stack: vertex and the next row position of each
+            vertices = [root]
+            cursors = [offsets[root]]
+            while vertices:
+                top = vertices[-1]
+                i = cursors[-1]
+
+                if i < offsets[top + 1]:
+                    cursors[-1] = i + 1
+                    neighbor = targets[i]
+
+                    if index[neighbor] == -1:
+                        # "recurse" into the neighbor
+                        index[neighbor] = low[neighbor] = counter
+                        counter += 1
+                        stack.append(neighbor)
+                        on_stack[neighbor] = 1
+                        vertices.append(neighbor)
+                        cursors.append(offsets[neighbor])
+                    elif on_stack[neighbor] and index[neighbor] < low[top]:
+                        low[top] = index[neighbor]
+                    continue
+
+                # top is finished, "return" to its caller
+                vertices.pop()
+                cursors.pop()
+                if vertices and low[top] < low[vertices[-1]]:
+                    low[vertices[-1]] = low[top]
+
+                # top is the root of a component: pop the whole component
+                if low[top] == index[top]:
+                    component: list[int] = []
+                    while True:
+                        v = stack.pop()
+                        on_stack[v] = 0
+                        component.append(v + 1)
+                        if v == top:
+                            break
+                    components.append(component)
+
+        return components
+
+    def search_and_print(self, start: int, out: TextIO | None = None) -> None:
         """
         DFS와 BFS 결과를 출력
+        (방문 순서를 PRINT_CHUNK_SIZE개씩 끊어서 out(기본값: sys.stdout)에 바로 씀)
+        stats가 설정되어 있으면 끝난 뒤 요약을 sys.stderr에 출력
         """
-        dfs_result = self.dfs(start)
-        bfs_result = self.bfs(start)
-        
-        print(' '.join(map(str, dfs_result)))
-        print(' '.join(map(str, bfs_result)))
\ No newline at end of file
+        if out is None:
+            out = sys.stdout
+
+        stats = self.stats
+        if stats is None:
+            write_path(out, self.iter_dfs(start))
+            write_path(out, self.iter_bfs(start))
+            return
+
+        # profiled: finish each traversal first so formatting is timed apart
+        for path in (self.dfs(start), self.bfs(start)):
+            started = perf_counter()
+            write_path(out, path)
+            stats.add_phase("format", perf_counter() - started)
+
+        print(stats.report(), file=sys.stderr)
+
+
+def write_path(out: TextIO, path: Iterable[int]) -> None:
+    """
+    정점 번호들을 공백으로 구분한 한 줄로 출력
+    ' '.join 한 줄 전체를 만들지 않고 PRINT_CHUNK_SIZE개씩 나눠서 씀
+    """
+    it = iter(path)
+    sep = ''
+    while True:
+        chunk = list(islice(it, PRINT_CHUNK_SIZE))
+        if not chunk:
+            break
+
+        out.write(sep + ' '.join(map(str, chunk)))
+        sep = ' '
+
+    out.write('\n')
\ No newline at end of file
@@ -1,4 +1,5 @@
-from lib import create_circular_queue, rotate_and_remove
+from lib import create_circular_queue, rotate_and_remove, write_josephus
+import sys
 
 
 """
@@ -32,10 +33,10 @@ def solve_josephus() -> None:
     n: int
     k: int
     n, k = map(int, input().split())
-    result: list[int] = josephus_problem(n, k)
-    
+
     # 출력 형식: <3, 6, 2, 7, 5, 1, 4>
-    print("<" + ", ".join(map(str, result)) + ">")
+    # (제거 순서를 리스트로 모으지 않고 버퍼에 나눠서 바로 씀)
+    write_josephus(n, k, sys.stdout.buffer)
 
 if __name__ == "__main__":
     solve_josephus()
\ No newline at end of file
@@ -1,4 +1,4 @@
-from lib import create_circular_queue
+from lib import card_game_survivor, create_circular_queue
 
 
 """
@@ -15,6 +15,7 @@ def simulate_card_game(n: int) -> int:
     """
     카드2 문제의 시뮬레이션
     맨 위 카드를 버리고, 그 다음 카드를 맨 아래로 이동
+    (풀이는 card_game_survivor를 사용하고, 이 함수는 검증용으로 남겨 둠)
     """
     queue:deque[int] = create_circular_queue(n)
     while len(queue) > 1:
@@ -26,7 +27,7 @@ def simulate_card_game(n: int) -> int:
 def solve_card2() -> None:
     """입, 출력 format"""
     n: int = int(input())
-    result: int = simulate_card_game(n)
+    result: int = card_game_survivor(n)
     print(result)
 
 if __name__ == "__main__":
@@ -0,0 +1,154 @@
+from importlib import import_module
+from lib import card_game_survivor
+from time import perf_counter
+from typing import Callable
+import lib
+import sys
+
+
+"""
+2164.py / 11866.py 검증 및 벤치마크
+
+사용법: python bench.py [suite] [args...]
+- suite: 아래 SUITES 중 하나 또는 all (기본값 all, all이면 args 없이 기본값으로 실행)
+  - card2 [check_max] [simulate_max]
+    1..check_max의 모든 n과 simulate_max 이하의 2의 거듭제곱 경계(p-1, p, p+1)에서
+    card_game_survivor(n) == simulate_card_game(n)인지 확인하고,
+    10^3..10^9 크기에서 두 방식의 시간을 표로 출력 (시뮬레이션은 simulate_max 이하에서만)
+    (기본값 check_max=2000, simulate_max=10000000)
+  - josephus [ns] [ks]
+    쉼표로 구분한 n, k의 모든 조합에서 11866.py의 josephus_problem(deque 회전)과
+    iter_josephus의 CntFenwickTree 경로를 측정하고 결과가 같은지 확인
+    (JOSEPHUS_DEQUE_MAX_K를 정하는 데 사용, 기본값 ns=100000,300000
+     ks=1024,2048,4096,8192,16384)
+"""
+
+
+# the module names start with a digit, so they cannot be imported by name
+simulate_card_game: Callable[[int], int] = import_module("2164").simulate_card_game
+josephus_problem: Callable[[int, int], list[int]] = import_module("11866").josephus_problem
+
+# calls per size when timing card_game_survivor (one call is too short to time)
+CLOSED_FORM_REPEAT = 100_000
+
+
+def check_card2(check_max: int, simulate_max: int) -> int:
+    """
+    두 방식의 결과를 비교하고 확인한 n의 개수를 반환 (다르면 AssertionError)
+    """
+    sizes = set(range(1, check_max + 1))
+    p = 2
+    while p <= simulate_max:
+        sizes.update((p - 1, p, p + 1))
+        p *= 2
+
+    for n in sorted(sizes):
+        if card_game_survivor(n) != simulate_card_game(n):
+            raise AssertionError(f"card_game_survivor({n}) differs from simulate_card_game")
+
+    return len(sizes)
+
+
+def bench_card2(args: list[str]) -> None:
+    """
+    card2 검증 후 10^3..10^9 크기에서 simulate_card_game 한 번과
+    card_game_survivor 한 번의 시간 비교
+    """
+    check_max = int(args[0]) if len(args) >= 1 else 2000
+    simulate_max = int(args[1]) if len(args) >= 2 else 10_000_000
+
+    print(f"card2 checked {check_card2(check_max, simulate_max)} sizes")
+    print(f"{'n':>12}{'simulate':>14}{'closed form':>14}")
+
+    for exponent in range(3, 10):
+        n = 10 ** exponent
+
+        if n <= simulate_max:
+            start = perf_counter()
+            expected = simulate_card_game(n)
+            simulated = f"{(perf_counter() - start) * 1000:>12.1f}ms"
+        else:
+            expected = None
+            simulated = f"{'-':>14}"
+
+        start = perf_counter()
+        for _ in range(CLOSED_FORM_REPEAT):
+            result = card_game_survivor(n)
+        closed = f"{(perf_counter() - start) / CLOSED_FORM_REPEAT * 1e9:>12.0f}ns"
+
+        if expected is not None and result != expected:
+            raise AssertionError(f"card_game_survivor({n}) differs from simulate_card_game")
+
+        print(f"{n:>12}{simulated}{closed}")
+
+
+def fenwick_josephus(n: int, k: int) -> list[int]:
+    """
+    JOSEPHUS_DEQUE_MAX_K와 상관없이 iter_josephus의 CntFenwickTree 경로로 계산
+    """
+    saved = lib.JOSEPHUS_DEQUE_MAX_K
+    lib.JOSEPHUS_DEQUE_MAX_K = 0
+    try:
+        return list(lib.iter_josephus(n, k))
+    finally:
+        lib.JOSEPHUS_DEQUE_MAX_K = saved
+
+
+def bench_josephus(args: list[str]) -> None:
+    """
+    ns x ks의 모든 조합에서 deque 회전과 CntFenwickTree 경로를 측정하고 표로 출력
+    (chosen: 현재 JOSEPHUS_DEQUE_MAX_K에서 iter_josephus가 고르는 경로)
+    """
+    ns = [int(x) for x in args[0].split(",")] if len(args) >= 1 else [100_000, 300_000]
+    ks = [int(x) for x in args[1].split(",")] if len(args) >= 2 else [1024, 2048, 4096, 8192, 16384]
+
+    # every small case on both paths first
+    for n in range(1, 41):
+        for k in range(1, 50):
+            if fenwick_josephus(n, k) != josephus_problem(n, k):
+                raise AssertionError(f"fenwick path differs from josephus_problem (n={n}, k={k})")
+
+    print(f"josephus JOSEPHUS_DEQUE_MAX_K={lib.JOSEPHUS_DEQUE_MAX_K}")
+    print(f"{'n':>10}{'k':>8}{'deque':>12}{'fenwick':>12}{'chosen':>10}")
+
+    for n in ns:
+        for k in ks:
+            start = perf_counter()
+            expected = josephus_problem(n, k)
+            deque_time = perf_counter() - start
+
+            start = perf_counter()
+            result = fenwick_josephus(n, k)
+            fenwick_time = perf_counter() - start
+
+            if result != expected:
+                raise AssertionError(f"fenwick path differs from josephus_problem (n={n}, k={k})")
+
+            chosen = "deque" if k <= lib.JOSEPHUS_DEQUE_MAX_K else "fenwick"
+            print(f"{n:>10}{k:>8}{deque_time:>11.2f}s{fenwick_time:>11.2f}s{chosen:>10}")
+
+
+SUITES: dict[str, Callable[[list[str]], None]] = {
+    "card2": bench_card2,
+    "josephus": bench_josephus,
+}
+
+
+def main() -> None:
+    if (
+        len(sys.argv) > 4
+        or (len(sys.argv) >= 2 and sys.argv[1] not in (*SUITES, "all"))
+        or (len(sys.argv) >= 3 and sys.argv[1] == "all")
+    ):
+        print(f"usage: python bench.py [{'|'.join(SUITES)}|all] [args...]")
+        sys.exit(1)
+
+    suite = sys.argv[1] if len(sys.argv) >= 2 else "all"
+    names = list(SUITES) if suite == "all" else [suite]
+
+    for name in names:
+        SUITES[name](sys.argv[2:])
+
+
+if __name__ == "__main__":
+    main()
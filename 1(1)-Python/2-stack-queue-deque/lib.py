@@ -1,5 +1,28 @@
 from __future__ import annotations
+from array import array
 from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import BinaryIO, Callable, Generic, Hashable, Iterable, Iterator, Sized, TypeVar
+
+
+# RingBuffer.rotate moves up to this many elements one by one
+RING_SMALL_MOVE = 4
+
+# iter_josephus rotates a deque up to this k, above it uses CntFenwickTree
+# (measured crossover for n = 10^5..10^6, see "python bench.py josephus")
+JOSEPHUS_DEQUE_MAX_K = 6144
+
+# numbers formatted per write by write_josephus
+WRITE_CHUNK_SIZE = 1 << 12
+
+# numbers kept by each Josephus cache, least recently used entries first out
+# (bounded by stored numbers, not entries, since one entry holds O(n) numbers)
+JOSEPHUS_CACHE_ITEMS = 1 << 21
+
+T = TypeVar('T')
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V', bound=Sized)
 
 
 """
@@ -12,7 +35,14 @@ def create_circular_queue(n: int) -> deque[int]:
     """1부터 n까지의 숫자로 deque를 생성합니다."""
     return deque(range(1, n + 1))
 
-def rotate_and_remove(queue: deque[int], k: int) -> int:
+def create_ring_buffer(n: int) -> RingBuffer:
+    """
+    1부터 n까지의 숫자로 RingBuffer를 생성합니다.
+    deque보다 메모리를 약 1/10만 쓰지만 k번째 제거는 2~5배 느림 (iter_josephus의 compact 경로)
+    """
+    return RingBuffer(array('i', range(1, n + 1)))
+
+def rotate_and_remove(queue: deque[int] | RingBuffer, k: int) -> int:
     """
     큐에서 k번째 원소를 제거하고 반환합니다.
     """
@@ -21,4 +51,391 @@ def rotate_and_remove(queue: deque[int], k: int) -> int:
     ret = queue.popleft()
 
     # return the kth element
-    return ret
\ No newline at end of file
+    return ret
+
+def card_game_survivor(n: int) -> int:
+    """
+    카드2 문제의 마지막 카드를 시뮬레이션 없이 O(1)에 계산합니다.
+    (덱을 만들지 않으며, 2164.py의 simulate_card_game과 결과가 같음)
+    """
+    # every full pass halves the deck and keeps the even cards, so with
+    # p = the largest power of two <= n the survivor is 2 * (n - p), or n
+    # itself when n is a power of two
+    p = 1 << (n.bit_length() - 1)
+    return n if n == p else 2 * (n - p)
+
+
+class RingBuffer:
+    """
+    A circular queue of ints stored in a single array('i').
+
+    Keeps only a head index and a length, so it uses 4 bytes per element
+    instead of a boxed int plus a pointer as in collections.deque.
+    Supports the deque operations used by the helpers in this module, and
+    backs the memory-bounded path of iter_josephus (compact=True).
+    """
+    __slots__ = ('_data', '_head', '_len')
+
+    def __init__(self, data: array[int] | None = None) -> None:
+        # The buffer starts full when initial data is given
+        # (keep at least one slot so index arithmetic never divides by 0)
+        self._data: array[int] = data if data else array('i', [0])
+        self._head = 0
+        self._len = len(data) if data else 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, idx: int) -> int:
+        """Returns the idx-th element from the front (0-based)."""
+        if not -self._len <= idx < self._len:
+            raise IndexError("RingBuffer index out of range")
+        return self._data[(self._head + idx % self._len) % len(self._data)]
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._read(0, self._len))
+
+    def _read(self, start: int, count: int) -> array[int]:
+        """Copies `count` elements starting at logical index `start`."""
+        data = self._data
+        cap = len(data)
+        pos = (self._head + start) % cap
+
+        # The range is contiguous unless it wraps past the end of the array
+        if pos + count <= cap:
+            return data[pos:pos + count]
+        return data[pos:] + data[:pos + count - cap]
+
+    def _write(self, pos: int, values: array[int]) -> None:
+        """Writes `values` starting at physical index `pos`, wrapping around."""
+        data = self._data
+        first = min(len(values), len(data) - pos)
+        data[pos:pos + first] = values[:first]
+        data[:len(values) - first] = values[first:]
+
+    def append(self, value: int) -> None:
+        """Adds `value` to the back, doubling the capacity when full."""
+        cap = len(self._data)
+        if self._len == cap:
+            # Unroll the ring into a twice as large array starting at 0
+            self._data = self._read(0, self._len) + array('i', [0]) * cap
+            self._head = 0
+            cap *= 2
+
+        self._data[(self._head + self._len) % cap] = value
+        self._len += 1
+
+    def popleft(self) -> int:
+        """Removes and returns the front element."""
+        if not self._len:
+            raise IndexError("pop from an empty RingBuffer")
+
+        value = self._data[self._head]
+        self._head = (self._head + 1) % len(self._data)
+        self._len -= 1
+        return value
+
+    def rotate(self, n: int = 1) -> None:
+        """
+        Rotates like deque.rotate: n > 0 moves the last n elements to the
+        front, n < 0 moves the first -n elements to the back.
+
+        O(1) only when the buffer is full (only the head moves); once an
+        element has been popped it copies min(n, len - n) elements, one by
+        one up to RING_SMALL_MOVE and with slice assignments above that.
+        """
+        size = self._len
+        if size <= 1:
+            return
+
+        # Number of elements to move from the front to the back
+        left = -n % size
+        if not left:
+            return
+
+        data = self._data
+        cap = len(data)
+        if size == cap:
+            self._head = (self._head + left) % cap
+        elif left <= RING_SMALL_MOVE:
+            # A few element moves are cheaper than building slices
+            head = self._head
+            for _ in range(left):
+                data[(head + size) % cap] = data[head]
+                head = (head + 1) % cap
+            self._head = head
+        elif left <= size - left:
+            # Front elements go into the free slots after the tail
+            moved = self._read(0, left)
+            self._write((self._head + size) % cap, moved)
+            self._head = (self._head + left) % cap
+        else:
+            # Back elements go into the free slots before the head
+            right = size - left
+            moved = self._read(size - right, right)
+            self._head = (self._head - right) % cap
+            self._write(self._head, moved)
+
+    def remove_kth(self, k: int) -> int:
+        """
+        Removes and returns the k-th element (1-based), like rotate_and_remove.
+
+        The buffer is never full after the first removal, so each call copies
+        min(k - 1, len - k + 1) elements; this is 2-5x slower than deque and
+        only pays off for its memory use.
+        """
+        self.rotate(-(k - 1))
+        return self.popleft()
+
+
+class CntFenwickTree:
+    """
+    A Fenwick (binary indexed) tree over counts.
+
+    Supports point updates and finding the index of the k-th counted item
+    in O(log n), like CntSegmentTree.find_kth but with n + 1 slots only.
+    """
+    __slots__ = ('_size', '_top', '_tree')
+
+    def __init__(self, size: int, fill: int = 0) -> None:
+        self._size = size
+
+        # Largest power of two not exceeding size (start of the k-th descent)
+        self._top = 1 << (size.bit_length() - 1) if size else 0
+
+        # With every count equal to fill, node i covers (i & -i) slots
+        self._tree: list[int] = [0] + [(i & -i) * fill for i in range(1, size + 1)]
+
+    def add(self, idx: int, delta: int) -> None:
+        """Adds `delta` to the count at index `idx` (0-based)."""
+        tree = self._tree
+        size = self._size
+
+        idx += 1
+        while idx <= size:
+            tree[idx] += delta
+            idx += idx & -idx
+
+    def find_kth(self, k: int) -> int:
+        """
+        Finds the index (0-based) of the k-th counted item (1-based rank).
+        """
+        tree = self._tree  # Local variable caching for performance
+        size = self._size
+
+        # Binary lifting: grow pos while the prefix stays below k
+        pos = 0
+        step = self._top
+        while step:
+            nxt = pos + step
+            if nxt <= size and tree[nxt] < k:
+                pos = nxt
+                k -= tree[nxt]
+            step >>= 1
+
+        return pos
+
+
+class SizedCache(Generic[K, V]):
+    """
+    An LRU cache bounded by the total len() of its values.
+
+    functools.lru_cache counts entries, which says nothing about memory when
+    one entry holds O(n) numbers. Values larger than the whole capacity are
+    not kept. A value that grew in place is re-measured by putting it again.
+    """
+    __slots__ = ('capacity', '_entries', '_items')
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+
+        # dict order is the recency order, least recently used first
+        self._entries: dict[K, V] = {}
+        self._items = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K) -> V | None:
+        """Returns the value for `key` (marking it most recent) or None."""
+        value = self._entries.pop(key, None)
+        if value is not None:
+            self._entries[key] = value
+        return value
+
+    def put(self, key: K, value: V) -> None:
+        """Stores `value` as the most recent entry, evicting old ones to fit."""
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._items -= len(old)
+
+        size = len(value)
+        if size > self.capacity:
+            return
+
+        entries = self._entries
+        while self._items + size > self.capacity:
+            self._items -= len(entries.pop(next(iter(entries))))
+
+        entries[key] = value
+        self._items += size
+
+    def clear(self) -> None:
+        """Drops every entry."""
+        self._entries.clear()
+        self._items = 0
+
+
+def josephus_order(n: int, k: int) -> list[int]:
+    """
+    요세푸스 순열을 계산합니다. (iter_josephus의 결과를 리스트로 모음)
+    k <= JOSEPHUS_DEQUE_MAX_K(6144)이면 deque 회전으로 O(n·k),
+    그보다 크면 CntFenwickTree의 k번째 원소 탐색으로 O(n log n)에 제거할 사람을 찾음
+    """
+    return list(iter_josephus(n, k))
+
+def iter_josephus(n: int, k: int, compact: bool = False) -> Iterator[int]:
+    """
+    요세푸스 순열을 제거되는 순서대로 하나씩 내보내는 제너레이터입니다.
+    (결과 리스트를 만들지 않음)
+    compact: True면 k <= JOSEPHUS_DEQUE_MAX_K에서 deque(사람당 약 40바이트) 대신
+             RingBuffer(사람당 4바이트)로 회전 (2~5배 느림, 더 큰 k에는 영향 없음)
+    """
+    if k <= JOSEPHUS_DEQUE_MAX_K:
+        # Short C-level rotations beat the O(log n) Fenwick descent
+        queue: deque[int] | RingBuffer = (
+            create_ring_buffer(n) if compact else create_circular_queue(n)
+        )
+        while queue:
+            yield rotate_and_remove(queue, k)
+        return
+
+    alive = CntFenwickTree(n, 1)
+
+    # rank (0-based) of the next victim among the people still alive
+    rank = 0
+    for remaining in range(n, 0, -1):
+        rank = (rank + k - 1) % remaining
+        victim = alive.find_kth(rank + 1)
+        alive.add(victim, -1)
+        yield victim + 1
+
+def write_josephus(n: int, k: int, out: BinaryIO, compact: bool = False) -> None:
+    """
+    요세푸스 순열을 "<a, b, c>" 형식으로 out(바이너리 스트림)에 씁니다.
+    WRITE_CHUNK_SIZE개씩 끊어서 쓰므로 전체 문자열을 만들지 않습니다.
+    compact: iter_josephus의 compact와 같음 (메모리를 줄이는 대신 느림)
+    """
+    order = iter_josephus(n, k, compact)
+    out.write(b'<')
+
+    sep = b''
+    while True:
+        chunk = list(islice(order, WRITE_CHUNK_SIZE))
+        if not chunk:
+            break
+
+        out.write(sep + ', '.join(map(str, chunk)).encode())
+        sep = b', '
+
+    out.write(b'>\n')
+
+
+# (n, k) -> josephus order
+josephus_order_cache: SizedCache[tuple[int, int], tuple[int, ...]] = SizedCache(JOSEPHUS_CACHE_ITEMS)
+
+# k -> survivors for 0..m people, grown in place as larger m are asked for
+josephus_survivor_cache: SizedCache[int, array[int]] = SizedCache(JOSEPHUS_CACHE_ITEMS)
+
+def cached_josephus_order(n: int, k: int) -> tuple[int, ...]:
+    """
+    josephus_order의 캐시 버전입니다. (같은 (n, k)는 다시 계산하지 않음)
+    캐시를 공유하므로 수정할 수 없는 tuple로 반환합니다.
+    캐시는 저장된 수의 총 개수가 JOSEPHUS_CACHE_ITEMS를 넘지 않게 오래된 것부터 버림
+    """
+    order = josephus_order_cache.get((n, k))
+    if order is None:
+        order = tuple(iter_josephus(n, k))
+    josephus_order_cache.put((n, k), order)
+    return order
+
+def josephus_survivors(n: int, k: int) -> array[int]:
+    """
+    인원이 0..n명일 때 각각의 마지막 생존자(1-based)를 O(n)에 계산합니다.
+    (0명 자리는 0, 캐시된 표의 복사본을 반환)
+    k마다 표를 하나만 캐시하고, 더 큰 n이 오면 마지막 n부터 이어서 늘림
+    """
+    table = josephus_survivor_cache.get(k)
+    if table is None:
+        table = array('i', [0])
+
+    if len(table) <= n:
+        # J(1) = 0, J(m) = (J(m - 1) + k) % m  (0-based survivor among m people)
+        # (resume from the last stored m; -1 for a new table is harmless as % 1 gives 0)
+        survivor = table[-1] - 1
+        for m in range(len(table), n + 1):
+            survivor = (survivor + k) % m
+            table.append(survivor + 1)
+
+    josephus_survivor_cache.put(k, table)
+    return table[:n + 1]
+
+def _map_unique(
+    func: Callable[[int, int], T],
+    queries: list[tuple[int, int]],
+    workers: int
+) -> dict[tuple[int, int], T]:
+    """
+    중복을 제거한 (n, k)마다 func를 한 번씩 호출한 결과를 반환합니다.
+    workers > 1이면 프로세스 풀에서 나눠서 계산합니다.
+    """
+    unique = list(dict.fromkeys(queries))
+    if workers <= 1 or len(unique) <= 1:
+        return {query: func(*query) for query in unique}
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        ns, ks = zip(*unique)
+        return dict(zip(unique, executor.map(func, ns, ks)))
+
+def batch_josephus(
+    queries: Iterable[tuple[int, int]],
+    workers: int = 1
+) -> list[tuple[int, ...]]:
+    """
+    여러 (n, k)에 대한 요세푸스 순열을 입력 순서대로 반환합니다.
+    workers: 1이면 현재 프로세스에서 cached_josephus_order로 계산,
+             2 이상이면 그 수만큼의 프로세스로 나눠서 계산
+             (각 프로세스의 캐시를 쓰므로 현재 프로세스의 캐시는 읽지도 채우지도 않음)
+    """
+    queries = list(queries)
+    results = _map_unique(cached_josephus_order, queries, workers)
+    return [results[query] for query in queries]
+
+def batch_josephus_survivors(
+    queries: Iterable[tuple[int, int]],
+    workers: int = 1
+) -> list[int]:
+    """
+    여러 (n, k)에 대한 마지막 생존자를 입력 순서대로 반환합니다.
+    k가 같은 질의는 가장 큰 n까지 josephus_survivors를 한 번만 훑어서 답함
+    workers: 2 이상이면 프로세스 풀에서 계산
+             (각 프로세스의 캐시를 쓰므로 현재 프로세스의 캐시는 읽지도 채우지도 않음)
+    """
+    queries = list(queries)
+
+    # largest n asked for each k
+    largest: dict[int, int] = {}
+    for n, k in queries:
+        largest[k] = max(n, largest.get(k, 0))
+
+    tables = _map_unique(
+        josephus_survivors, [(n, k) for k, n in largest.items()], workers
+    )
+    return [tables[largest[k], k][n] for n, k in queries]
+
+def batch_card_game(ns: Iterable[int]) -> list[int]:
+    """
+    여러 n에 대한 카드2 문제의 마지막 카드를 입력 순서대로 반환합니다.
+    (card_game_survivor가 O(1)이라 캐시나 프로세스 풀은 쓰지 않음)
+    """
+    return [card_game_survivor(n) for n in ns]
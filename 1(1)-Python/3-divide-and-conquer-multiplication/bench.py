@@ -0,0 +1,93 @@
+from lib import Matrix
+from time import perf_counter
+from typing import Literal
+import random
+import sys
+
+
+"""
+Matrix 곱셈 커널 벤치마크
+- 크기와 MOD를 바꿔 가며 각 (BACKEND, KERNEL) 조합으로 A @ B를 측정
+- 모든 조합의 결과가 첫 번째 조합과 같은지도 함께 확인
+
+사용법: python bench.py [sizes] [mods] [python_max]
+- sizes: 쉼표로 구분한 행렬 크기 (기본값 64,128,256,512)
+- mods: 쉼표로 구분한 MOD 값 (기본값 1000,1000000007)
+- python_max: 순수 파이썬 백엔드를 측정할 최대 크기 (기본값 128)
+"""
+
+
+KERNELS: list[tuple[Literal["python", "numpy"], Literal["direct", "blocked", "strassen"]]] = [
+    ("python", "direct"),
+    ("numpy", "direct"),
+    ("numpy", "blocked"),
+    ("numpy", "strassen"),
+]
+
+
+def measure(
+    a: Matrix,
+    b: Matrix,
+    backend: Literal["python", "numpy"],
+    kernel: Literal["direct", "blocked", "strassen"]
+) -> tuple[float, Matrix]:
+    """
+    A @ B를 한 번 계산하고 (걸린 시간(초), 결과)를 반환
+    """
+    Matrix.BACKEND = backend
+    Matrix.KERNEL = kernel
+
+    start = perf_counter()
+    result = a @ b
+    return perf_counter() - start, result
+
+
+def run(sizes: list[int], mods: list[int], python_max: int) -> None:
+    """
+    sizes x mods의 모든 조합에 대해 KERNELS를 측정하고 표로 출력
+    """
+    header = "".join(f"{backend + '/' + kernel:>18}" for backend, kernel in KERNELS)
+    print(f"{'MOD':>20}{'n':>6}{header}")
+
+    # warm up (the first NumPy call also pays for the lazy import)
+    for backend, kernel in KERNELS:
+        measure(Matrix.eye(2), Matrix.eye(2), backend, kernel)
+
+    rng = random.Random(0)
+    for mod in mods:
+        Matrix.MOD = mod
+        for n in sizes:
+            a = Matrix([[rng.randrange(mod) for _ in range(n)] for _ in range(n)])
+            b = Matrix([[rng.randrange(mod) for _ in range(n)] for _ in range(n)])
+
+            expected: Matrix | None = None
+            cells: list[str] = []
+            for backend, kernel in KERNELS:
+                if backend == "python" and n > python_max:
+                    cells.append(f"{'-':>18}")
+                    continue
+
+                elapsed, result = measure(a, b, backend, kernel)
+                if expected is None:
+                    expected = result
+                elif result.matrix != expected.matrix:
+                    raise AssertionError(f"{backend}/{kernel} differs (MOD={mod}, n={n})")
+                cells.append(f"{elapsed * 1000:>16.1f}ms")
+
+            print(f"{mod:>20}{n:>6}{''.join(cells)}")
+
+
+def main() -> None:
+    if len(sys.argv) > 4:
+        print("usage: python bench.py [sizes] [mods] [python_max]")
+        sys.exit(1)
+
+    sizes = [int(x) for x in sys.argv[1].split(",")] if len(sys.argv) >= 2 else [64, 128, 256, 512]
+    mods = [int(x) for x in sys.argv[2].split(",")] if len(sys.argv) >= 3 else [1000, 1000000007]
+    python_max = int(sys.argv[3]) if len(sys.argv) == 4 else 128
+
+    run(sizes, mods, python_max)
+
+
+if __name__ == "__main__":
+    main()
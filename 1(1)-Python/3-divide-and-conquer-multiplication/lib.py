@@ -1,63 +1,166 @@
 from __future__ import annotations
-import copy
+from array import array
+from importlib import import_module
+from operator import mul
+from typing import Any, Iterable, Literal, Sequence, TypeAlias
+
+
+# Largest value an int64 accumulator can hold in the NumPy backend
+INT64_MAX = (1 << 63) - 1
+
+# Integers up to this are exact in float64, so float64 matmul (BLAS) gives
+# exact integer sums as long as every partial sum stays below it
+FLOAT_EXACT_MAX = 1 << 53
+
+# Flat row-major element storage: array('q') while every reduced value fits
+# in int64, a plain list for larger moduli
+Storage: TypeAlias = "array[int] | list[int]"
+
+# A 2-D NumPy int64 array. NumPy is optional and imported lazily through
+# import_module, so the default "python" backend type-checks without it
+Int64Array: TypeAlias = Any
+
+# How a kernel reduced its sums modulo MOD (see Matrix.reduction):
+# "once": once per element, "chunked": every few terms (pure Python),
+# "eager": after every term (pure Python),
+# "limbs": per limb of the right operand (NumPy),
+# "float": exact float64 products of split operands (NumPy)
+Reduction: TypeAlias = Literal["once", "chunked", "eager", "limbs", "float"]
+
+# The pure-Python kernel reduces in inner-dimension chunks only if a chunk
+# spans at least this many terms; narrower chunks are slower than reducing
+# after every term
+PYTHON_MIN_CHUNK = 32
+
+
+def _storage(values: Iterable[int], mod: int) -> Storage:
+    """
+    Packs reduced values into array('q') if MOD - 1 fits in int64,
+    otherwise into a list.
+    """
+    if mod - 1 <= INT64_MAX:
+        return array('q', values)
+    return list(values)
 
 
 class Matrix:
     """
     A class to represent a matrix and perform matrix operations
     under a specific modulo.
+
+    Each matrix keeps its own modulus (`mod`), taken from the class
+    attribute MOD when none is given, so matrices with different moduli
+    can be used side by side (and from several threads) without touching
+    Matrix.MOD. Both operands of @ must share the same modulus.
+
+    Elements are stored row-major in one flat buffer (see Storage),
+    so element (i, j) lives at index i * cols + j.
+
+    Results of @ and ** record the reduction strategy their kernel used in
+    `reduction` (a debugging aid; None for matrices built any other way).
     """
+    __slots__ = ('_data', '_rows', '_cols', '_mod', 'reduction')
+
+    # Default modulus for matrices created without an explicit one
     MOD = 1000
 
-    def __init__(self, matrix: list[list[int]]) -> None:
+    # "python": pure-Python loops, "numpy": int64 matmul (requires NumPy)
+    BACKEND: Literal["python", "numpy"] = "python"
+
+    # NumPy backend kernel for the int64 products:
+    # "direct": one matmul, "blocked": BLOCK_SIZE x BLOCK_SIZE tiles,
+    # "strassen": Strassen recursion down to STRASSEN_CUTOFF, then "blocked"
+    # (the "float" reduction multiplies in BLAS, which tiles on its own)
+    KERNEL: Literal["direct", "blocked", "strassen"] = "direct"
+    BLOCK_SIZE = 128
+    STRASSEN_CUTOFF = 128
+
+    def __init__(self, matrix: list[list[int]], mod: int | None = None) -> None:
         """
         Initializes the Matrix object.
 
         Args:
             matrix (list[list[int]]): A 2D list representing the matrix data.
+            mod (int | None): The modulus (defaults to Matrix.MOD).
         """
-        self.matrix = [[elem % self.MOD for elem in row] for row in matrix]
+        if mod is None:
+            mod = self.MOD
+        self._mod = mod
+        self._rows = len(matrix)
+        self._cols = len(matrix[0]) if matrix else 0
+        self._data: Storage = _storage(
+            (elem % mod for row in matrix for elem in row), mod
+        )
+        self.reduction: Reduction | None = None
 
     @staticmethod
-    def full(n: int, shape: tuple[int, int]) -> Matrix:
+    def _from_flat(
+        data: Storage,
+        rows: int,
+        cols: int,
+        mod: int,
+        reduction: Reduction | None = None
+    ) -> Matrix:
+        """
+        Wraps a flat row-major buffer that is already reduced modulo mod
+        without copying or re-reducing it (internal constructor for kernel
+        results).
+        """
+        result = Matrix.__new__(Matrix)
+        result._data = data
+        result._rows = rows
+        result._cols = cols
+        result._mod = mod
+        result.reduction = reduction
+        return result
+
+    @staticmethod
+    def full(n: int, shape: tuple[int, int], mod: int | None = None) -> Matrix:
         """
         Creates a matrix of a given shape filled with the value n.
 
         Args:
             n (int): The value to fill the matrix with.
             shape (tuple[int, int]): A tuple (rows, columns).
+            mod (int | None): The modulus (defaults to Matrix.MOD).
 
         Returns:
             Matrix: A new Matrix object.
         """
-        return Matrix([[n] * shape[1] for _ in range(shape[0])])
+        rows, cols = shape
+        if mod is None:
+            mod = Matrix.MOD
+        return Matrix._from_flat(
+            _storage([n % mod] * (rows * cols), mod), rows, cols, mod
+        )
 
     @staticmethod
-    def zeros(shape: tuple[int, int]) -> Matrix:
+    def zeros(shape: tuple[int, int], mod: int | None = None) -> Matrix:
         """
         Creates a matrix of a given shape filled with zeros.
         """
-        return Matrix.full(0, shape)
+        return Matrix.full(0, shape, mod)
 
     @staticmethod
-    def ones(shape: tuple[int, int]) -> Matrix:
+    def ones(shape: tuple[int, int], mod: int | None = None) -> Matrix:
         """
         Creates a matrix of a given shape filled with ones.
         """
-        return Matrix.full(1, shape)
+        return Matrix.full(1, shape, mod)
 
     @staticmethod
-    def eye(n: int) -> Matrix:
+    def eye(n: int, mod: int | None = None) -> Matrix:
         """
         Creates an identity matrix of size n x n.
 
         Args:
             n (int): The size of the matrix (rows and columns).
+            mod (int | None): The modulus (defaults to Matrix.MOD).
 
         Returns:
             Matrix: An identity matrix.
         """
-        matrix = Matrix.zeros((n, n))
+        matrix = Matrix.zeros((n, n), mod)
         for i in range(n):
             matrix[i, i] = 1
         return matrix
@@ -67,30 +170,66 @@ class Matrix:
         """
         Returns the shape of the matrix as (rows, columns).
         """
-        return len(self.matrix), len(self.matrix[0])
+        return self._rows, self._cols
+
+    @property
+    def mod(self) -> int:
+        """
+        Returns the modulus of this matrix.
+        """
+        return self._mod
+
+    @property
+    def matrix(self) -> list[list[int]]:
+        """
+        Returns the elements as a new 2D list (rows of columns).
+        """
+        data, cols = self._data, self._cols
+        return [list(data[i:i + cols]) for i in range(0, self._rows * cols, cols)]
 
     def clone(self) -> Matrix:
         """
-        Creates a deep copy of the matrix.
+        Creates a copy of the matrix (a single buffer copy).
+        """
+        return Matrix._from_flat(
+            self._data[:], self._rows, self._cols, self._mod, self.reduction
+        )
+
+    def row(self, i: int) -> Sequence[int]:
+        """
+        Returns row i. For array('q') storage this is a memoryview over the
+        matrix buffer (no copy, writes go through); otherwise a list copy.
         """
-        return Matrix(copy.deepcopy(self.matrix))
+        start = i * self._cols
+        if isinstance(self._data, array):
+            return memoryview(self._data)[start:start + self._cols]
+        return self._data[start:start + self._cols]
+
+    def col(self, j: int) -> Sequence[int]:
+        """
+        Returns column j. For array('q') storage this is a strided memoryview
+        over the matrix buffer (no copy, writes go through); otherwise a list copy.
+        """
+        if isinstance(self._data, array):
+            return memoryview(self._data)[j::self._cols]
+        return self._data[j::self._cols]
 
     def __getitem__(self, key: tuple[int, int]) -> int:
         """
         Allows access to matrix elements using m[row, col].
         """
-        return self.matrix[key[0]][key[1]]
+        return self._data[key[0] * self._cols + key[1]]
 
     def __setitem__(self, key: tuple[int, int], value: int) -> None:
         """
         Allows setting matrix elements using m[row, col] = value.
         """
-        self.matrix[key[0]][key[1]] = value
+        self._data[key[0] * self._cols + key[1]] = value
 
     def __matmul__(self, other: Matrix) -> Matrix:
         """
         Implements matrix multiplication using the @ operator.
-        Performs the operation (A * B) % MOD.
+        Performs the operation (A * B) % mod.
 
         Args:
             other (Matrix): The matrix to multiply with.
@@ -102,51 +241,457 @@ class Matrix:
         rows_b, cols_b = other.shape
 
         assert cols_a == rows_b, "Matrix dimensions do not match for multiplication."
+        assert self._mod == other._mod, "Matrix moduli do not match for multiplication."
+
+        if self.BACKEND == "numpy":
+            product = self._matmul_numpy(other)
+            if product is not None:
+                return product
+        elif self.BACKEND != "python":
+            raise ValueError(f"unknown matrix backend: {self.BACKEND}")
+
+        reduction, chunk = self._python_plan(cols_a)
+        result = self.zeros((rows_a, cols_b), self._mod)
+        self._multiply_into(
+            self._data, other._data, result._data, rows_a, cols_a, cols_b, self._mod, chunk
+        )
+        result.reduction = reduction
+        return result
+
+    def _chunk_size(self) -> int:
+        """
+        Returns how many products of reduced values can be added to a
+        reduced running sum before it could exceed INT64_MAX:
+        (mod - 1) + chunk * (mod - 1)^2 <= INT64_MAX.
+        """
+        top = self._mod - 1
+        if top <= 0:
+            return INT64_MAX
+        return (INT64_MAX - top) // (top * top)
+
+    def _python_plan(self, inner: int) -> tuple[Reduction, int]:
+        """
+        Picks the reduction strategy of the pure-Python kernel.
+
+        Python ints never overflow, but sums that stay within int64 keep
+        the fast C paths of sum() and small-int arithmetic.
+
+        Returns:
+            tuple[Reduction, int]: The strategy and the number of terms
+            summed per reduction.
+        """
+        chunk = self._chunk_size()
+        if chunk >= inner:
+            return "once", inner
+        if chunk >= PYTHON_MIN_CHUNK:
+            return "chunked", chunk
+        return "eager", 1
+
+    @staticmethod
+    def _multiply_into(
+        a: Storage,
+        b: Storage,
+        out: Storage,
+        rows: int,
+        inner: int,
+        cols: int,
+        mod: int,
+        chunk: int = 1
+    ) -> None:
+        """
+        Pure-Python kernel: writes (a * b) % mod into the existing buffer out.
 
-        result = self.zeros((rows_a, cols_b))
+        Args:
+            a (Storage): Left operand, rows x inner, row-major.
+            b (Storage): Right operand, inner x cols, row-major.
+            out (Storage): Preallocated rows x cols result (must not alias a or b).
+            rows, inner, cols (int): The dimensions.
+            mod (int): The modulus.
+            chunk (int): Number of terms summed before each reduction
+                (see _python_plan; 1 reduces after every term).
+        """
+        # Contiguous copies of b's columns, so the inner loop walks two
+        # sequences in step instead of striding through b
+        b_cols = [b[j::cols] for j in range(cols)]
 
-        for i in range(rows_a):
-            for j in range(cols_b):
+        pos = 0
+        for start in range(0, rows * inner, inner):
+            row_a = a[start:start + inner]
+            for col_b in b_cols:
                 val = 0
-                for k in range(cols_a):
-                    val += self[i, k] * other[k, j]
-                    # Note: Applying modulo at each addition prevents overflow
-                    # and keeps numbers small for efficiency.
-                    val %= self.MOD
-                result[i, j] = val
+                if chunk == 1:
+                    for x, y in zip(row_a, col_b):
+                        val += x * y
+                        # Note: Applying modulo at each addition prevents overflow
+                        # and keeps numbers small for efficiency.
+                        val %= mod
+                elif chunk >= inner:
+                    val = sum(map(mul, row_a, col_b)) % mod
+                else:
+                    for k in range(0, inner, chunk):
+                        val = (val + sum(map(mul, row_a[k:k + chunk], col_b[k:k + chunk]))) % mod
+                out[pos] = val
+                pos += 1
+
+    def _numpy_plan(self, inner: int) -> tuple[Reduction, int] | None:
+        """
+        Picks the reduction strategy of the NumPy kernels.
+
+        - "once": a full int64 product cannot overflow
+        - "float": split both operands into `half`-bit halves and multiply
+          them in float64 (see _numpy_float_into); used for large moduli
+          such as 1e9+7, where BLAS beats NumPy's integer matmul. Wherever
+          reducing in inner-dimension chunks would also fit in int64, this
+          is faster (no chunked strategy in the NumPy backend)
+        - "limbs": split the right operand into limbs of `shift` bits, where
+          every limb value (and the Horner step) must satisfy
+          (mod - 1) * inner * (2^shift + 1) <= INT64_MAX
+
+        Returns:
+            tuple[Reduction, int] | None: The strategy and its parameter
+            (inner, half or shift), or None if the modulus is too large for
+            int64 limbs.
+        """
+        if self._chunk_size() >= inner:
+            return "once", inner
+
+        half = self._float_half(inner)
+        if half is not None:
+            return "float", half
+
+        limit = INT64_MAX // max(self._mod - 1, 1) // max(inner, 1)
+        if limit < 3:
+            return None
+        return "limbs", (limit - 1).bit_length() - 1
+
+    def _float_half(self, inner: int) -> int | None:
+        """
+        Returns the split width for the "float" strategy, or None if it
+        cannot be exact for this modulus and inner dimension.
+
+        Halves are at most 2^half - 1, so the cross product
+        (a0 + a1) @ (b0 + b1) sums at most inner * (2^(half + 1) - 2)^2,
+        which must stay within FLOAT_EXACT_MAX; recombining the reduced
+        parts multiplies two values below mod, which must fit in int64.
+        """
+        top = self._mod - 1
+        if top * top > INT64_MAX:
+            return None
 
+        half = (top.bit_length() + 1) // 2
+        if inner * ((2 << half) - 2) ** 2 > FLOAT_EXACT_MAX:
+            return None
+        return half
+
+    def _numpy_multiply_into(
+        self,
+        a: Int64Array,
+        b: Int64Array,
+        out: Int64Array,
+        mod: int,
+        plan: tuple[Reduction, int]
+    ) -> None:
+        """
+        NumPy kernel: writes (a * b) % mod into out (must not alias a or b).
+        Dispatches on KERNEL; see _numpy_reduce_into for the overflow
+        handling shared by all kernels.
+        """
+        if self.KERNEL == "strassen":
+            out[...] = self._strassen(a, b, mod, plan)
+        else:
+            self._numpy_reduce_into(a, b, out, mod, plan)
+
+    def _numpy_reduce_into(
+        self,
+        a: Int64Array,
+        b: Int64Array,
+        out: Int64Array,
+        mod: int,
+        plan: tuple[Reduction, int]
+    ) -> None:
+        """
+        Writes (a * b) % mod into out (must not alias a or b), following
+        the reduction strategy from _numpy_plan.
+
+        With "limbs", `b` is split into limbs of `shift` bits
+        (b = sum(limb_j * 2^(shift * j))); each limb product is reduced
+        separately and the limbs are recombined with Horner's rule, so the
+        result matches the pure-Python path.
+        """
+        np: Any = import_module("numpy")
+
+        reduction, param = plan
+        if reduction == "float":
+            self._numpy_float_into(a, b, out, mod, param)
+            return
+        if reduction == "once":
+            if self.KERNEL == "direct":
+                np.matmul(a, b, out=out)
+            else:
+                out[...] = self._numpy_product(a, b)
+            np.remainder(out, mod, out=out)
+            return
+
+        out.fill(0)
+        shift = param
+        bits = (mod - 1).bit_length()
+        mask = (1 << shift) - 1
+        for j in reversed(range(0, bits, shift)):
+            limb = (b >> j) & mask
+            out <<= shift
+            out += self._numpy_product(a, limb) % mod
+            np.remainder(out, mod, out=out)
+
+    @staticmethod
+    def _numpy_float_into(
+        a: Int64Array,
+        b: Int64Array,
+        out: Int64Array,
+        mod: int,
+        half: int
+    ) -> None:
+        """
+        Writes (a * b) % mod into out using three float64 matmuls.
+
+        With a = a1 * 2^half + a0 (and b likewise),
+        a @ b = high * 2^(2 half) + cross * 2^half + low, where
+        high = a1 @ b1, low = a0 @ b0 and
+        cross = (a0 + a1) @ (b0 + b1) - high - low (Karatsuba).
+        _float_half keeps every float64 sum below FLOAT_EXACT_MAX, so the
+        products are exact integers; BLAS does its own cache blocking.
+        """
+        np: Any = import_module("numpy")
+
+        mask = (1 << half) - 1
+        a0 = (a & mask).astype(np.float64)
+        a1 = (a >> half).astype(np.float64)
+        b0 = (b & mask).astype(np.float64)
+        b1 = (b >> half).astype(np.float64)
+
+        high = (a1 @ b1).astype(np.int64) % mod
+        low = (a0 @ b0).astype(np.int64) % mod
+        cross = ((a0 + a1) @ (b0 + b1)).astype(np.int64)
+        cross = (cross - high - low) % mod
+
+        np.multiply(high, (1 << (2 * half)) % mod, out=out)
+        out %= mod
+        out += (cross << half) % mod
+        out += low
+        np.remainder(out, mod, out=out)
+
+    def _numpy_product(
+        self,
+        a: Int64Array,
+        b: Int64Array
+    ) -> Int64Array:
+        """
+        Returns the unreduced int64 product a @ b, tiled unless KERNEL is
+        "direct". Tiling sums the same terms, so the overflow bound does not
+        change, but each tile product stays in cache.
+        """
+        np: Any = import_module("numpy")
+
+        if self.KERNEL == "direct":
+            return a @ b
+        if self.KERNEL not in ("blocked", "strassen"):
+            raise ValueError(f"unknown matrix kernel: {self.KERNEL}")
+
+        rows, inner = a.shape
+        cols = b.shape[1]
+        bs = self.BLOCK_SIZE
+
+        out = np.zeros((rows, cols), dtype=np.int64)
+        for i in range(0, rows, bs):
+            for k in range(0, inner, bs):
+                a_ik = a[i:i + bs, k:k + bs]
+                for j in range(0, cols, bs):
+                    out[i:i + bs, j:j + bs] += a_ik @ b[k:k + bs, j:j + bs]
+
+        return out
+
+    def _strassen(
+        self,
+        a: Int64Array,
+        b: Int64Array,
+        mod: int,
+        plan: tuple[Reduction, int]
+    ) -> Int64Array:
+        """
+        Returns (a * b) % mod by Strassen's recursion (7 half-size products
+        instead of 8). Operands are kept reduced modulo MOD at every level
+        and the inner dimension only shrinks, so the base case can use the
+        plan made for the full product.
+        """
+        np: Any = import_module("numpy")
+
+        rows, inner = a.shape
+        cols = b.shape[1]
+
+        if min(rows, inner, cols) <= self.STRASSEN_CUTOFF:
+            out = np.empty((rows, cols), dtype=np.int64)
+            self._numpy_reduce_into(a, b, out, mod, plan)
+            return out
+
+        if rows % 2 or inner % 2 or cols % 2:
+            # Pad odd dimensions with a zero row/column, then drop it
+            a = np.pad(a, ((0, rows % 2), (0, inner % 2)))
+            b = np.pad(b, ((0, inner % 2), (0, cols % 2)))
+            return self._strassen(a, b, mod, plan)[:rows, :cols]
+
+        r, h, c = rows // 2, inner // 2, cols // 2
+        a11, a12, a21, a22 = a[:r, :h], a[:r, h:], a[r:, :h], a[r:, h:]
+        b11, b12, b21, b22 = b[:h, :c], b[:h, c:], b[h:, :c], b[h:, c:]
+
+        m1 = self._strassen((a11 + a22) % mod, (b11 + b22) % mod, mod, plan)
+        m2 = self._strassen((a21 + a22) % mod, b11, mod, plan)
+        m3 = self._strassen(a11, (b12 - b22) % mod, mod, plan)
+        m4 = self._strassen(a22, (b21 - b11) % mod, mod, plan)
+        m5 = self._strassen((a11 + a12) % mod, b22, mod, plan)
+        m6 = self._strassen((a21 - a11) % mod, (b11 + b12) % mod, mod, plan)
+        m7 = self._strassen((a12 - a22) % mod, (b21 + b22) % mod, mod, plan)
+
+        out = np.empty((rows, cols), dtype=np.int64)
+        out[:r, :c] = (m1 + m4 - m5 + m7) % mod
+        out[:r, c:] = (m3 + m5) % mod
+        out[r:, :c] = (m2 + m4) % mod
+        out[r:, c:] = (m1 - m2 + m3 + m6) % mod
+        return out
+
+    def _as_numpy(self) -> Int64Array:
+        """
+        Returns a rows x cols int64 view over the array('q') buffer (no copy).
+        """
+        np: Any = import_module("numpy")
+
+        # list storage only occurs when MOD is too large for the NumPy backend
+        assert isinstance(self._data, array)
+        return np.frombuffer(self._data, dtype=np.int64).reshape(self._rows, self._cols)
+
+    def _matmul_numpy(self, other: Matrix) -> Matrix | None:
+        """
+        Multiplies with NumPy int64 matmul, reducing modulo MOD as lazily as
+        _numpy_plan allows. Operands and the result are zero-copy views over
+        array('q') buffers.
+
+        Args:
+            other (Matrix): The matrix to multiply with.
+
+        Returns:
+            Matrix | None: The result, or None if MOD is too large for int64
+            limbs (the caller then falls back to the pure-Python path).
+        """
+        plan = self._numpy_plan(other._rows)
+        if plan is None:
+            return None
+
+        result = self.zeros((self._rows, other._cols), self._mod)
+        self._numpy_multiply_into(
+            self._as_numpy(), other._as_numpy(), result._as_numpy(), self._mod, plan
+        )
+        result.reduction = plan[0]
         return result
 
     def __pow__(self, n: int) -> Matrix:
         """
         Implements matrix exponentiation using the ** operator.
-        Uses the Binary Exponentiation (Divide and Conquer) algorithm
-        to achieve O(log n) time complexity.
+        Uses iterative Binary Exponentiation (square-and-multiply over the
+        bits of n, lowest first) to achieve O(log n) multiplications.
+
+        The running product, the running square and one scratch buffer are
+        allocated once and swapped between steps, so no intermediate Matrix
+        objects are created.
 
         Args:
             n (int): The exponent.
 
         Returns:
             Matrix: The result of self ** n.
+
+        Raises:
+            ValueError: If n is negative.
         """
+        if n < 0:
+            raise ValueError(f"negative matrix exponent: {n}")
         if n == 0:
             # Note: A matrix to the power of 0 is the Identity Matrix.
-            return self.eye(self.shape[0])
-        elif n == 1:
-            return self
+            return self.eye(self.shape[0], self._mod)
 
-        half = self.__pow__(n // 2)
+        size, cols = self.shape
+        assert n == 1 or size == cols, "Matrix must be square for exponentiation."
 
-        if n % 2 == 0:
-            # Even power: A^n = A^(n/2) * A^(n/2)
-            return half @ half
-        else:
-            # Odd power: A^n = A^(n/2) * A^(n/2) * A
-            return half @ half @ self
+        if self.BACKEND == "numpy":
+            power = self._pow_numpy(n)
+            if power is not None:
+                return power
+        elif self.BACKEND != "python":
+            raise ValueError(f"unknown matrix backend: {self.BACKEND}")
+
+        mod = self._mod
+        reduction, chunk = self._python_plan(size)
+        base = self._data[:]
+        scratch = self._data[:]
+
+        # None stands for the identity, so the first set bit only copies
+        acc: Storage | None = None
+        multiplied = n > 1
+
+        while True:
+            if n & 1:
+                if acc is None:
+                    acc = base[:]
+                else:
+                    self._multiply_into(acc, base, scratch, size, size, size, mod, chunk)
+                    acc, scratch = scratch, acc
+            n >>= 1
+            if not n:
+                break
+
+            self._multiply_into(base, base, scratch, size, size, size, mod, chunk)
+            base, scratch = scratch, base
+
+        assert acc is not None
+        return Matrix._from_flat(acc, size, cols, mod, reduction if multiplied else None)
+
+    def _pow_numpy(self, n: int) -> Matrix | None:
+        """
+        Same square-and-multiply loop as __pow__ over int64 arrays.
+
+        Returns:
+            Matrix | None: The result, or None if MOD is too large for int64
+            limbs (the caller then falls back to the pure-Python path).
+        """
+        plan = self._numpy_plan(self._rows)
+        if plan is None:
+            return None
+
+        mod = self._mod
+        base = self._as_numpy().copy()
+        scratch = base.copy()
+        acc: Int64Array | None = None
+        reduction = plan[0] if n > 1 else None
+
+        while True:
+            if n & 1:
+                if acc is None:
+                    acc = base.copy()
+                else:
+                    self._numpy_multiply_into(acc, base, scratch, mod, plan)
+                    acc, scratch = scratch, acc
+            n >>= 1
+            if not n:
+                break
+
+            self._numpy_multiply_into(base, base, scratch, mod, plan)
+            base, scratch = scratch, base
+
+        assert acc is not None
+        return Matrix._from_flat(
+            array('q', acc.tobytes()), self._rows, self._cols, mod, reduction
+        )
 
     def __repr__(self) -> str:
         """
         Returns a string representation of the matrix.
         Rows are separated by newlines, elements by spaces.
         """
-        return '\n'.join(' '.join(map(str, row)) for row in self.matrix)
\ No newline at end of file
+        return '\n'.join(' '.join(map(str, row)) for row in self.matrix)